@@ -17,14 +17,13 @@ async def example_basic():
     print("Example 1: 基本的なプレゼンテーション生成")
     print("=" * 60)
 
-    ceo = CEOAgent(output_dir="output")
-
-    result = await ceo.create_presentation({
-        "topic": "2024年度 事業計画",
-        "theme": "corporate",
-        "output_filename": "business_plan.pptx",
-        "num_slides": 5,
-    })
+    with CEOAgent(output_dir="output") as ceo:
+        result = await ceo.create_presentation({
+            "topic": "2024年度 事業計画",
+            "theme": "corporate",
+            "output_filename": "business_plan.pptx",
+            "num_slides": 5,
+        })
 
     print(f"\n結果: {'成功' if result['success'] else '失敗'}")
     if result['success']:
@@ -45,15 +44,14 @@ async def example_with_data():
         print(f"データファイルが見つかりません: {data_file}")
         return None
 
-    ceo = CEOAgent(output_dir="output")
-
-    result = await ceo.create_presentation({
-        "topic": "E社との比較分析",
-        "data_file": str(data_file),
-        "theme": "modern",
-        "output_filename": "e_company_comparison.pptx",
-        "num_slides": 6,
-    })
+    with CEOAgent(output_dir="output") as ceo:
+        result = await ceo.create_presentation({
+            "topic": "E社との比較分析",
+            "data_file": str(data_file),
+            "theme": "modern",
+            "output_filename": "e_company_comparison.pptx",
+            "num_slides": 6,
+        })
 
     print(f"\n結果: {'成功' if result['success'] else '失敗'}")
     if result['success']:
@@ -69,20 +67,20 @@ async def example_different_themes():
     print("=" * 60)
 
     themes = ["corporate", "modern", "vibrant"]
-    results = []
 
-    for theme in themes:
+    # A CEOAgent drives its sub-agents one task at a time, so concurrent
+    # runs each get their own CEO
+    async def run_one(theme: str):
         print(f"\n--- テーマ: {theme} ---")
-        ceo = CEOAgent(output_dir="output")
-
-        result = await ceo.create_presentation({
-            "topic": "製品紹介",
-            "theme": theme,
-            "output_filename": f"product_intro_{theme}.pptx",
-            "num_slides": 4,
-        })
-
-        results.append(result)
+        with CEOAgent(output_dir="output") as ceo:
+            return await ceo.create_presentation({
+                "topic": "製品紹介",
+                "theme": theme,
+                "output_filename": f"product_intro_{theme}.pptx",
+                "num_slides": 4,
+            })
+
+    results = await asyncio.gather(*(run_one(theme) for theme in themes))
 
     return results
 
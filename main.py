@@ -19,13 +19,6 @@ Options:
 import asyncio
 import argparse
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-
-from src.agents import CEOAgent
-
-
-console = Console()
 
 
 async def main():
@@ -75,6 +68,14 @@ async def main():
 
     args = parser.parse_args()
 
+    # Deferred so that --help and argument errors don't pay for importing
+    # rich and the agent stack
+    from rich.console import Console
+    from rich.panel import Panel
+    from src.agents import CEOAgent
+
+    console = Console()
+
     # Show header
     console.print(Panel(
         "[bold cyan]Multi-Agent PowerPoint Orchestrator[/bold cyan]\n\n"
@@ -91,9 +92,6 @@ async def main():
             console.print(f"[red]エラー: データファイルが見つかりません: {args.data_file}[/red]")
             return 1
 
-    # Initialize CEO Agent
-    ceo = CEOAgent(output_dir=args.output_dir)
-
     # Create requirements
     requirements = {
         "topic": args.topic,
@@ -103,9 +101,10 @@ async def main():
         "num_slides": args.num_slides,
     }
 
-    # Run the orchestration
+    # Run the orchestration (the CEO Agent's worker threads are released on exit)
     console.print()
-    result = await ceo.create_presentation(requirements)
+    with CEOAgent(output_dir=args.output_dir) as ceo:
+        result = await ceo.create_presentation(requirements)
 
     # Show result
     if result.get("success"):
@@ -129,7 +128,13 @@ async def main():
 
 def run():
     """Synchronous wrapper for main"""
-    return asyncio.run(main())
+    # uvloop is optional (and unavailable on Windows); fall back to the
+    # default asyncio event loop when it isn't installed
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main())
+    return uvloop.run(main())
 
 
 if __name__ == "__main__":
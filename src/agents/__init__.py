@@ -6,7 +6,8 @@ from .design_agent import DesignAgent
 from .builder_agent import BuilderAgent
 from .llm_agent import LLMAgent
 from .chart_agent import ChartAgent
-from .ceo_agent import CEOAgent, ExecutionMode
+from .ceo_agent import CEOAgent, ExecutionMode, PhaseError, PipelineResults
+from .job_runner import PresentationJobRunner
 
 __all__ = [
     "BaseAgent",
@@ -18,4 +19,7 @@ __all__ = [
     "ChartAgent",
     "CEOAgent",
     "ExecutionMode",
+    "PhaseError",
+    "PipelineResults",
+    "PresentationJobRunner",
 ]
@@ -1,13 +1,102 @@
 """Base Agent class that all specialized agents inherit from"""
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List, Dict
-from rich.console import Console
-from ..core.task import Task, TaskStatus
+from typing import Any, Callable, Optional, List, Dict, Deque
+from concurrent.futures import Executor
+from collections import deque
+import asyncio
+from ..core.task import Task, TaskStatus, TaskSummary
 from ..core.message import Message, MessageType
-import uuid
+import itertools
 
 
-console = Console()
+_console = None
+
+
+def get_console():
+    """Return the shared rich Console, importing rich on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# Maximum number of queued log renderables printed in one console write
+LOG_BATCH_SIZE = 16
+
+# Pending log output per running event loop
+_log_queues: Dict[Any, "asyncio.Queue[Any]"] = {}
+
+
+def _print_batch(items: List[Any]):
+    """Render a batch of queued log items with a single console write"""
+    if len(items) == 1:
+        get_console().print(items[0])
+    else:
+        from rich.console import Group
+        get_console().print(Group(*items))
+
+
+def _drain_log_queue(queue: "asyncio.Queue[Any]"):
+    """Synchronously print everything left in a log queue"""
+    while not queue.empty():
+        items = []
+        while not queue.empty() and len(items) < LOG_BATCH_SIZE:
+            items.append(queue.get_nowait())
+        _print_batch(items)
+
+
+async def _log_worker(loop: asyncio.AbstractEventLoop, queue: "asyncio.Queue[Any]"):
+    """Background consumer that renders queued log output in batches"""
+    try:
+        while True:
+            items = [await queue.get()]
+            while not queue.empty() and len(items) < LOG_BATCH_SIZE:
+                items.append(queue.get_nowait())
+            _print_batch(items)
+    finally:
+        _log_queues.pop(loop, None)
+        _drain_log_queue(queue)
+
+
+def emit_log(renderable: Any):
+    """
+    Queue a rich renderable for the current loop's log worker, keeping
+    console rendering out of the orchestration code path. Prints
+    immediately when called outside an event loop (e.g. worker threads).
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        get_console().print(renderable)
+        return
+
+    queue = _log_queues.get(loop)
+    if queue is None:
+        queue = _log_queues[loop] = asyncio.Queue()
+        loop.create_task(_log_worker(loop, queue))
+    queue.put_nowait(renderable)
+
+
+def flush_logs():
+    """Print any log output still queued on the current event loop"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    queue = _log_queues.get(loop)
+    if queue is not None:
+        _drain_log_queue(queue)
+
+
+# Maximum number of messages retained in each agent's inbox/outbox
+MAILBOX_SIZE = 1024
+
+# Maximum number of finished-task summaries retained per agent
+TASK_HISTORY_SIZE = 128
+
+# Process-local ID source for agents and their messages
+_id_counter = itertools.count()
 
 
 class BaseAgent(ABC):
@@ -21,33 +110,56 @@ class BaseAgent(ABC):
     - Communicate with other agents through messages
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "role",
+        "description",
+        "current_task",
+        "completed_tasks",
+        "_pending",
+        "_not_empty",
+        "inbox",
+        "outbox",
+        "executor",
+    )
+
     def __init__(self, name: str, role: str, description: str):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = f"{next(_id_counter):08x}"
         self.name = name
         self.role = role
         self.description = description
         self.current_task: Optional[Task] = None
-        self.completed_tasks: List[Task] = []
-        self.inbox: List[Message] = []
-        self.outbox: List[Message] = []
+        self._pending: Deque[Task] = deque()
+        self._not_empty = asyncio.Event()
+        self.completed_tasks: Deque[TaskSummary] = deque(maxlen=TASK_HISTORY_SIZE)
+        self.inbox: Deque[Message] = deque(maxlen=MAILBOX_SIZE)
+        self.outbox: Deque[Message] = deque(maxlen=MAILBOX_SIZE)
+        # Executor for blocking work (None = the loop's default executor)
+        self.executor: Optional[Executor] = None
 
     def log(self, message: str, style: str = ""):
         """Log a message with agent context"""
+        from rich.text import Text
         prefix = f"[bold blue][{self.name}][/bold blue]"
-        console.print(f"{prefix} {message}", style=style)
+        emit_log(Text.from_markup(f"{prefix} {message}", style=style))
 
     def receive_task(self, task: Task) -> bool:
-        """Receive a task assignment"""
-        if self.current_task is not None:
-            self.log(f"Cannot accept task '{task.name}' - already working on '{self.current_task.name}'", "yellow")
+        """Queue a task assignment; run() executes queued tasks in order"""
+        if len(self._pending) >= MAILBOX_SIZE:
+            self.log(f"Cannot accept task '{task.name}' - task queue is full", "yellow")
             return False
 
-        self.current_task = task
         task.assigned_to = self.name
-        task.start()
+        self._pending.append(task)
+        self._not_empty.set()
         self.log(f"Received task: {task.name}", "green")
         return True
 
+    async def wait_for_task(self):
+        """Wait until at least one task is queued"""
+        await self._not_empty.wait()
+
     def receive_message(self, message: Message):
         """Receive a message from another agent"""
         self.inbox.append(message)
@@ -56,7 +168,7 @@ class BaseAgent(ABC):
     def send_message(self, receiver: str, msg_type: MessageType, content: Any, metadata: dict = None) -> Message:
         """Send a message to another agent"""
         message = Message(
-            id=str(uuid.uuid4())[:8],
+            id=f"{self.id}-{next(_id_counter):08x}",
             sender=self.name,
             receiver=receiver,
             type=msg_type,
@@ -76,30 +188,86 @@ class BaseAgent(ABC):
         pass
 
     async def run(self) -> Optional[Any]:
-        """Run the current task to completion"""
-        if self.current_task is None:
+        """Run the next queued task to completion"""
+        if not self._pending:
             self.log("No task assigned", "yellow")
             return None
 
+        task = self.current_task = self._pending.popleft()
+        if not self._pending:
+            self._not_empty.clear()
+        task.start()
+
         try:
-            self.log(f"Starting execution of: {self.current_task.name}")
-            result = await self.execute_task(self.current_task)
-            self.current_task.complete(result)
-            self.completed_tasks.append(self.current_task)
-            self.log(f"Completed task: {self.current_task.name}", "green")
-
-            # Clear current task
-            completed_task = self.current_task
-            self.current_task = None
+            self.log(f"Starting execution of: {task.name}")
+            result = await self.execute_task(task)
+            task.complete(result)
+            self.completed_tasks.append(TaskSummary.from_task(task))
+            self.log(f"Completed task: {task.name}", "green")
             return result
 
         except Exception as e:
             error_msg = str(e)
-            self.current_task.fail(error_msg)
+            task.fail(error_msg)
+            self.completed_tasks.append(TaskSummary.from_task(task))
             self.log(f"Task failed: {error_msg}", "red")
-            self.current_task = None
             raise
 
+        finally:
+            if self.current_task is task:
+                self.current_task = None
+
+    async def run_blocking(self, func: Callable, *args: Any) -> Any:
+        """Run a blocking call on this agent's executor"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def run_sync(self, task: Optional[Task] = None) -> Optional[Any]:
+        """
+        Run ``task`` (or the next queued task) on a private event loop.
+        Intended for worker threads so blocking work stays off the caller's
+        loop; passing the task avoids racing other workers for the queue.
+        """
+        if task is not None:
+            return asyncio.run(self.run_batch([task]))[0]
+        return asyncio.run(self.run())
+
+    async def run_batch(self, tasks: List[Task]) -> List[Any]:
+        """
+        Run a batch of independent tasks concurrently and return their
+        results in order. Bypasses the single current_task slot, so
+        logging and scheduling overhead is paid once per batch.
+        Raises the first task error after every task has finished.
+        """
+        if not tasks:
+            return []
+
+        for task in tasks:
+            task.assigned_to = self.name
+            task.start()
+
+        names = ", ".join(t.name for t in tasks)
+        self.log(f"Running batch ({len(tasks)}): {names}")
+
+        results = await asyncio.gather(
+            *(self.execute_task(t) for t in tasks), return_exceptions=True
+        )
+
+        errors = []
+        for task, result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                task.fail(str(result))
+                errors.append(result)
+            else:
+                task.complete(result)
+            self.completed_tasks.append(TaskSummary.from_task(task))
+
+        if errors:
+            self.log(f"Batch failed: {errors[0]}", "red")
+            raise errors[0]
+
+        self.log(f"Completed batch ({len(tasks)})", "green")
+        return results
+
     def get_status(self) -> Dict:
         """Get current agent status"""
         return {
@@ -108,7 +276,8 @@ class BaseAgent(ABC):
             "role": self.role,
             "is_busy": self.current_task is not None,
             "current_task": self.current_task.name if self.current_task else None,
-            "completed_count": len(self.completed_tasks),
+            "pending_count": len(self._pending),
+            "completed_count": sum(1 for t in self.completed_tasks if t.success),
             "inbox_count": len(self.inbox),
         }
 
@@ -1,14 +1,215 @@
 """Builder Agent - Responsible for actual PowerPoint file generation"""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
 from pathlib import Path
+import asyncio
+import copy
+import functools
+import io
+import os
+import re
+import threading
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.oxml.ns import qn
+from lxml import etree
 from .base_agent import BaseAgent
 from ..core.task import Task
 
 
+# Layout geometry (EMU), computed once at import time
+_SLIDE_W = Inches(10)
+_SLIDE_H = Inches(5.625)  # 16:9
+_TITLE_LEFT = Inches(0.5)
+_TITLE_W = Inches(9)
+_TITLE_TOP_MAIN = Inches(2)
+_TITLE_H_MAIN = Inches(1.5)
+_SUBTITLE_TOP = Inches(3.5)
+_SUBTITLE_H = Inches(1)
+_TITLE_TOP_CONTENT = Inches(0.3)
+_TITLE_H = Inches(0.8)
+_BODY_TOP = Inches(1.3)
+_BODY_W = Inches(9)
+_BODY_H = Inches(4)
+_COL_W = Inches(4.2)
+_COL_LEFT_X = Inches(0.5)
+_COL_RIGHT_X = Inches(5.2)
+
+# Fixed font sizes
+_PT_TITLE = Pt(32)
+_PT_SUB = Pt(24)
+_PT_COL = Pt(16)
+_PT_SPACE = Pt(12)
+
+
+@functools.lru_cache(maxsize=32)
+def _pt(size) -> Pt:
+    """Pt() for theme-configurable font sizes (cached per size)"""
+    return Pt(size)
+
+
+# Output directories already created by this process
+_created_dirs: Set[Path] = set()
+_created_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: Path):
+    """mkdir -p, skipping the syscalls for directories created earlier"""
+    if path in _created_dirs:
+        return
+    with _created_dirs_lock:
+        if path not in _created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_template() -> Presentation:
+    """Default 16:9 presentation, loaded once and cloned per build"""
+    prs = Presentation()
+    prs.slide_width = _SLIDE_W
+    prs.slide_height = _SLIDE_H
+    return prs
+
+
+@functools.lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color: str) -> RGBColor:
+    """Convert hex color to RGBColor (cached per unique hex string)"""
+    v = int(hex_color.lstrip('#')[:6], 16)
+    return RGBColor((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
+
+def _save_pptx(prs: Presentation, output_path: Path):
+    """Serialize to memory, then write the file with raw os.write calls"""
+    buf = io.BytesIO()
+    prs.save(buf)
+    data = buf.getbuffer()
+    fd = os.open(str(output_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        data.release()
+        os.close(fd)
+
+
+# Pre-qualified DrawingML tag names for bullet paragraphs
+_A_BR = qn("a:br")
+_A_P = qn("a:p")
+_A_PPR = qn("a:pPr")
+_A_SPCAFT = qn("a:spcAft")
+_A_SPCPTS = qn("a:spcPts")
+_A_R = qn("a:r")
+_A_RPR = qn("a:rPr")
+_A_SOLIDFILL = qn("a:solidFill")
+_A_SRGBCLR = qn("a:srgbClr")
+_A_T = qn("a:t")
+
+_BULLET = "• "
+
+# Line breaks within an item become <a:br/>; other XML-illegal control
+# characters are escaped as "_xHHHH_", matching python-pptx's paragraph.text
+_LINE_BREAK = re.compile("\n|\v")
+_CTRL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+def _escape_ctrl_char(match: "re.Match") -> str:
+    """re.sub replacement for one control character"""
+    return "_x%04X_" % ord(match.group())
+
+
+def _add_run_props(parent, size: str, rgb_hex: str):
+    """Append <a:rPr> with font size and solid color to a run or break"""
+    rPr = etree.SubElement(parent, _A_RPR, sz=size)
+    etree.SubElement(etree.SubElement(rPr, _A_SOLIDFILL), _A_SRGBCLR, val=rgb_hex)
+
+
+def _write_bullets(
+    text_frame,
+    items,
+    size_centipoints: int,
+    rgb_hex: str,
+    space_after_centipoints: Optional[int] = None,
+):
+    """Write bullet paragraphs straight into the frame's <a:txBody>"""
+    txBody = text_frame._txBody
+    for p in txBody.findall(_A_P):
+        txBody.remove(p)
+
+    size = str(size_centipoints)
+    space_after = str(space_after_centipoints) if space_after_centipoints is not None else None
+    for item in items:
+        p = etree.SubElement(txBody, _A_P)
+        if space_after is not None:
+            spc_aft = etree.SubElement(etree.SubElement(p, _A_PPR), _A_SPCAFT)
+            etree.SubElement(spc_aft, _A_SPCPTS, val=space_after)
+        text = _BULLET + (item if isinstance(item, str) else str(item))
+        for idx, line in enumerate(_LINE_BREAK.split(text)):
+            if idx:
+                _add_run_props(etree.SubElement(p, _A_BR), size, rgb_hex)
+            if line:
+                r = etree.SubElement(p, _A_R)
+                _add_run_props(r, size, rgb_hex)
+                etree.SubElement(r, _A_T).text = _CTRL_CHARS.sub(_escape_ctrl_char, line)
+
+
+_DEFAULT_COLORS = {"primary": "1F4E79", "text": "333333", "background": "FFFFFF"}
+_DEFAULT_TITLE_FONT = {"name": "Yu Gothic UI", "size": 36, "bold": True}
+_DEFAULT_BODY_FONT = {"name": "Yu Gothic UI", "size": 18, "bold": False}
+
+
+@dataclass(frozen=True, slots=True)
+class SlideSpec:
+    """Slide content resolved once from the content dict"""
+    type: str
+    title: str
+    subtitle: Optional[str]
+    body: Tuple[Any, ...]
+    left: Tuple[Any, ...]
+    right: Tuple[Any, ...]
+
+    @classmethod
+    def from_content(cls, content: Dict) -> "SlideSpec":
+        return cls(
+            type=content.get("type", "content"),
+            title=content.get("title", ""),
+            subtitle=content.get("subtitle"),
+            body=tuple(content.get("body", content.get("items", [])) or ()),
+            left=tuple(content.get("left") or ()),
+            right=tuple(content.get("right") or ()),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeSpec:
+    """Theme colors and fonts pre-resolved to python-pptx values"""
+    primary_rgb: RGBColor
+    text_rgb: RGBColor
+    text_hex: str
+    title_size: Pt
+    title_bold: bool
+    body_size: Pt
+
+    @classmethod
+    def from_theme(cls, theme: Dict) -> "ThemeSpec":
+        colors = theme.get("colors", _DEFAULT_COLORS)
+        fonts = theme.get("fonts", {})
+        title_font = fonts.get("title", _DEFAULT_TITLE_FONT)
+        body_font = fonts.get("body", _DEFAULT_BODY_FONT)
+        text_rgb = _hex_to_rgb(colors.get("text", "333333"))
+        return cls(
+            primary_rgb=_hex_to_rgb(colors.get("primary", "1F4E79")),
+            text_rgb=text_rgb,
+            text_hex=str(text_rgb),
+            title_size=_pt(title_font.get("size", 44)),
+            title_bold=title_font.get("bold", True),
+            body_size=_pt(body_font.get("size", 18)),
+        )
+
+
 class BuilderAgent(BaseAgent):
     """
     Builder Agent: Generates the actual PowerPoint file.
@@ -21,6 +222,8 @@ class BuilderAgent(BaseAgent):
     - Save output files
     """
 
+    __slots__ = ("output_dir",)
+
     def __init__(self, output_dir: str = "output"):
         super().__init__(
             name="BuilderAgent",
@@ -28,7 +231,12 @@ class BuilderAgent(BaseAgent):
             description="Generates PowerPoint files using python-pptx library"
         )
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.output_dir)
+
+    @staticmethod
+    def warm_up():
+        """Load the base presentation template ahead of the first build"""
+        _get_template()
 
     async def execute_task(self, task: Task) -> Any:
         """Execute build-related tasks"""
@@ -37,213 +245,157 @@ class BuilderAgent(BaseAgent):
         if task_type == "build_presentation":
             return await self._build_presentation(task.input_data)
         elif task_type == "build_slide":
-            return await self._build_slide(task.input_data)
+            return await self.run_blocking(self._build_slide, task.input_data)
         elif task_type == "save_presentation":
-            return await self._save_presentation(task.input_data)
+            return await self.run_blocking(self._save_presentation, task.input_data)
         else:
             return await self._build_presentation(task.input_data)
 
-    def _hex_to_rgb(self, hex_color: str) -> RGBColor:
-        """Convert hex color to RGBColor"""
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return RGBColor(r, g, b)
-
     async def _build_presentation(self, input_data: Dict) -> Dict:
         """Build complete PowerPoint presentation"""
         content = input_data.get("content", {})
-        design = input_data.get("design", {})
+        # None when the design phase failed in parallel mode: default theme
+        design = input_data.get("design") or {}
         filename = input_data.get("filename", "presentation.pptx")
 
         self.log("Building PowerPoint presentation...")
 
-        # Create presentation
-        prs = Presentation()
-
-        # Set slide dimensions (16:9)
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(5.625)
+        # Clone the pre-sized 16:9 template instead of re-reading default.pptx
+        prs = copy.deepcopy(_get_template())
 
-        # Get theme colors
-        theme = design.get("theme", {})
-        colors = theme.get("colors", {
-            "primary": "1F4E79",
-            "text": "333333",
-            "background": "FFFFFF",
-        })
+        # Resolve theme colors/fonts and slide content once up front
+        theme = ThemeSpec.from_theme(design.get("theme", {}))
+        specs = [SlideSpec.from_content(c) for c in content.get("slides", [])]
 
-        # Build each slide
-        for i, slide_content in enumerate(content.get("slides", [])):
-            slide_design = None
-            if "slides" in design and i < len(design["slides"]):
-                slide_design = design["slides"][i]
+        # Add all blank slides on the event-loop thread so slide order is
+        # deterministic and prs.slides is only mutated from one thread
+        blank_layout = prs.slide_layouts[6]  # Blank layout
+        jobs = [(prs.slides.add_slide(blank_layout), spec) for spec in specs]
 
-            await self._add_slide(prs, slide_content, slide_design, colors, theme)
+        # Populate slides concurrently; each slide owns its own XML part
+        await asyncio.gather(*[
+            self.run_blocking(self._populate_slide, slide, spec, theme)
+            for slide, spec in jobs
+        ])
 
         # Save presentation
         output_path = self.output_dir / filename
-        prs.save(str(output_path))
+        await self.run_blocking(_save_pptx, prs, output_path)
 
         self.log(f"Presentation saved to: {output_path}")
 
         return {
             "success": True,
             "file_path": str(output_path),
-            "slide_count": len(content.get("slides", [])),
+            "slide_count": len(specs),
         }
 
-    async def _add_slide(
-        self,
-        prs: Presentation,
-        content: Dict,
-        design: Optional[Dict],
-        colors: Dict,
-        theme: Dict
-    ):
-        """Add a single slide to the presentation"""
-        slide_type = content.get("type", "content")
+    def _populate_slide(self, slide, spec: SlideSpec, theme: ThemeSpec):
+        """Populate a single (already added) slide with its content"""
+        builder = self._SLIDE_BUILDERS.get(spec.type, BuilderAgent._build_content_slide)
+        builder(self, slide, spec, theme)
 
-        # Use blank layout
-        blank_layout = prs.slide_layouts[6]  # Blank layout
-        slide = prs.slides.add_slide(blank_layout)
-
-        # Get font settings
-        fonts = theme.get("fonts", {})
-        title_font = fonts.get("title", {"name": "Yu Gothic UI", "size": 36, "bold": True})
-        body_font = fonts.get("body", {"name": "Yu Gothic UI", "size": 18, "bold": False})
-
-        if slide_type == "title":
-            await self._build_title_slide(slide, content, colors, title_font)
-        elif slide_type == "agenda":
-            await self._build_content_slide(slide, content, colors, title_font, body_font)
-        elif slide_type in ["content", "conclusion"]:
-            await self._build_content_slide(slide, content, colors, title_font, body_font)
-        elif slide_type in ["two_column", "comparison"]:
-            await self._build_two_column_slide(slide, content, colors, title_font, body_font)
-        else:
-            await self._build_content_slide(slide, content, colors, title_font, body_font)
-
-    async def _build_title_slide(self, slide, content: Dict, colors: Dict, title_font: Dict):
+    def _build_title_slide(self, slide, spec: SlideSpec, theme: ThemeSpec):
         """Build a title slide"""
         # Title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(2), Inches(9), Inches(1.5)
-        )
-        title_frame = title_box.text_frame
-        title_para = title_frame.paragraphs[0]
-        title_para.text = content.get("title", "")
-        title_para.font.size = Pt(title_font.get("size", 44))
-        title_para.font.bold = title_font.get("bold", True)
-        title_para.font.color.rgb = self._hex_to_rgb(colors.get("primary", "1F4E79"))
-        title_para.alignment = PP_ALIGN.CENTER
+        if spec.title:
+            title_box = slide.shapes.add_textbox(
+                _TITLE_LEFT, _TITLE_TOP_MAIN, _TITLE_W, _TITLE_H_MAIN
+            )
+            title_frame = title_box.text_frame
+            title_para = title_frame.paragraphs[0]
+            title_para.text = spec.title
+            title_para.font.size = theme.title_size
+            title_para.font.bold = theme.title_bold
+            title_para.font.color.rgb = theme.primary_rgb
+            title_para.alignment = PP_ALIGN.CENTER
 
         # Subtitle
-        if content.get("subtitle"):
+        if spec.subtitle:
             subtitle_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(3.5), Inches(9), Inches(1)
+                _TITLE_LEFT, _SUBTITLE_TOP, _TITLE_W, _SUBTITLE_H
             )
             subtitle_frame = subtitle_box.text_frame
             subtitle_para = subtitle_frame.paragraphs[0]
-            subtitle_para.text = content.get("subtitle", "")
-            subtitle_para.font.size = Pt(24)
-            subtitle_para.font.color.rgb = self._hex_to_rgb(colors.get("text", "333333"))
+            subtitle_para.text = spec.subtitle
+            subtitle_para.font.size = _PT_SUB
+            subtitle_para.font.color.rgb = theme.text_rgb
             subtitle_para.alignment = PP_ALIGN.CENTER
 
-    async def _build_content_slide(
-        self, slide, content: Dict, colors: Dict, title_font: Dict, body_font: Dict
-    ):
+    def _build_content_slide(self, slide, spec: SlideSpec, theme: ThemeSpec):
         """Build a content slide with bullet points"""
         # Title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.3), Inches(9), Inches(0.8)
-        )
-        title_frame = title_box.text_frame
-        title_para = title_frame.paragraphs[0]
-        title_para.text = content.get("title", "")
-        title_para.font.size = Pt(32)
-        title_para.font.bold = True
-        title_para.font.color.rgb = self._hex_to_rgb(colors.get("primary", "1F4E79"))
+        self._build_slide_title(slide, spec, theme)
 
         # Body content
-        body_items = content.get("body", content.get("items", []))
-        if body_items:
-            body_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(1.3), Inches(9), Inches(4)
-            )
-            body_frame = body_box.text_frame
-            body_frame.word_wrap = True
-
-            for i, item in enumerate(body_items):
-                if i == 0:
-                    para = body_frame.paragraphs[0]
-                else:
-                    para = body_frame.add_paragraph()
-
-                para.text = f"• {item}"
-                para.font.size = Pt(body_font.get("size", 18))
-                para.font.color.rgb = self._hex_to_rgb(colors.get("text", "333333"))
-                para.space_after = Pt(12)
-
-    async def _build_two_column_slide(
-        self, slide, content: Dict, colors: Dict, title_font: Dict, body_font: Dict
-    ):
+        self._build_bullet_column(
+            slide,
+            spec.body,
+            _TITLE_LEFT,
+            _BODY_W,
+            theme.body_size.centipoints,
+            theme.text_hex,
+            _PT_SPACE.centipoints,
+        )
+
+    def _build_two_column_slide(self, slide, spec: SlideSpec, theme: ThemeSpec):
         """Build a two-column slide"""
         # Title
+        self._build_slide_title(slide, spec, theme)
+
+        # Left / right columns
+        size = _PT_COL.centipoints
+        for items, left in ((spec.left, _COL_LEFT_X), (spec.right, _COL_RIGHT_X)):
+            self._build_bullet_column(slide, items, left, _COL_W, size, theme.text_hex)
+
+    def _build_slide_title(self, slide, spec: SlideSpec, theme: ThemeSpec):
+        """Add the top-left title textbox (skipped when the title is empty)"""
+        if not spec.title:
+            return
         title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.3), Inches(9), Inches(0.8)
+            _TITLE_LEFT, _TITLE_TOP_CONTENT, _TITLE_W, _TITLE_H
         )
-        title_frame = title_box.text_frame
-        title_para = title_frame.paragraphs[0]
-        title_para.text = content.get("title", "")
-        title_para.font.size = Pt(32)
+        title_para = title_box.text_frame.paragraphs[0]
+        title_para.text = spec.title
+        title_para.font.size = _PT_TITLE
         title_para.font.bold = True
-        title_para.font.color.rgb = self._hex_to_rgb(colors.get("primary", "1F4E79"))
+        title_para.font.color.rgb = theme.primary_rgb
 
-        # Left column
-        left_items = content.get("left", [])
-        if left_items:
-            left_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(1.3), Inches(4.2), Inches(4)
-            )
-            left_frame = left_box.text_frame
-            left_frame.word_wrap = True
-
-            for i, item in enumerate(left_items):
-                if i == 0:
-                    para = left_frame.paragraphs[0]
-                else:
-                    para = left_frame.add_paragraph()
-                para.text = f"• {item}"
-                para.font.size = Pt(16)
-                para.font.color.rgb = self._hex_to_rgb(colors.get("text", "333333"))
-
-        # Right column
-        right_items = content.get("right", [])
-        if right_items:
-            right_box = slide.shapes.add_textbox(
-                Inches(5.2), Inches(1.3), Inches(4.2), Inches(4)
-            )
-            right_frame = right_box.text_frame
-            right_frame.word_wrap = True
-
-            for i, item in enumerate(right_items):
-                if i == 0:
-                    para = right_frame.paragraphs[0]
-                else:
-                    para = right_frame.add_paragraph()
-                para.text = f"• {item}"
-                para.font.size = Pt(16)
-                para.font.color.rgb = self._hex_to_rgb(colors.get("text", "333333"))
-
-    async def _build_slide(self, input_data: Dict) -> Dict:
+    def _build_bullet_column(
+        self,
+        slide,
+        items,
+        left,
+        width,
+        size_centipoints: int,
+        rgb_hex: str,
+        space_after_centipoints: Optional[int] = None,
+    ):
+        """Add a word-wrapped bullet-list textbox below the slide title"""
+        if not items:
+            return
+        box = slide.shapes.add_textbox(left, _BODY_TOP, width, _BODY_H)
+        frame = box.text_frame
+        frame.word_wrap = True
+        _write_bullets(frame, items, size_centipoints, rgb_hex, space_after_centipoints)
+
+    # Slide type -> builder dispatch table (unknown types render as content)
+    _SLIDE_BUILDERS = {
+        "title": _build_title_slide,
+        "agenda": _build_content_slide,
+        "content": _build_content_slide,
+        "conclusion": _build_content_slide,
+        "two_column": _build_two_column_slide,
+        "comparison": _build_two_column_slide,
+    }
+
+    def _build_slide(self, input_data: Dict) -> Dict:
         """Build a single slide (for incremental building)"""
         # This would be used for building slides one at a time
         self.log("Building individual slide...")
         return {"success": True, "message": "Slide built"}
 
-    async def _save_presentation(self, input_data: Dict) -> Dict:
+    def _save_presentation(self, input_data: Dict) -> Dict:
         """Save presentation to file"""
         presentation = input_data.get("presentation")
         filename = input_data.get("filename", "output.pptx")
@@ -252,7 +404,7 @@ class BuilderAgent(BaseAgent):
             raise ValueError("No presentation object provided")
 
         output_path = self.output_dir / filename
-        presentation.save(str(output_path))
+        _save_pptx(presentation, output_path)
 
         self.log(f"Saved presentation: {output_path}")
         return {"success": True, "file_path": str(output_path)}
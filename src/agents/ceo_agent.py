@@ -1,29 +1,105 @@
 """CEO Agent - The Orchestrator that manages all other agents"""
-from typing import Any, Dict, List, Optional, Callable
-from rich.console import Console
+from typing import Any, Dict, Iterator, List, Optional, Callable, Tuple
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.table import Table
+from rich.text import Text
+from rich.console import Group
 from rich.live import Live
+from rich.errors import LiveError
 from rich.layout import Layout
 import asyncio
-import uuid
+import concurrent.futures
+import contextlib
+import copy
+import dataclasses
+import itertools
+import os
+import shutil
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, emit_log, flush_logs, get_console
 from .research_agent import ResearchAgent
 from .content_agent import ContentAgent
 from .design_agent import DesignAgent
 from .builder_agent import BuilderAgent
-from .llm_agent import LLMAgent
+from .llm_agent import FALLBACK_FLAG, LLMAgent
 from .chart_agent import ChartAgent
 from ..core.task import Task, TaskStatus
-from ..core.workflow import Workflow
+from ..core.workflow import Node, Workflow, WorkflowEngine
 from ..core.message import Message, MessageType
 from ..core.templates import PresentationTemplate
+from ..core.pipeline_cache import PipelineCache, hash_input
+from ..utils.serialization import dumps
 
 
-console = Console()
+# Maximum number of memoized sub-task results kept per CEOAgent
+SUBTASK_CACHE_SIZE = 256
+
+# Default worker count for the shared thread pool (override with NEXPRO_POOL)
+DEFAULT_POOL_WORKERS = os.cpu_count() or 4
+
+# Events accepted by CEOAgent.register_hook
+HOOK_EVENTS = ("on_phase_start", "on_phase_complete", "on_task_complete", "on_error")
+
+# Display name and description per task type dispatched by the CEO
+_TASK_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "analyze_and_extract": ("データ分析", "Analyze data from {file_path}"),
+    "generate_content": ("AIコンテンツ生成", "Generate content using AI"),
+    "create_outline": ("アウトライン作成", "Create presentation outline"),
+    "create_full_content": ("コンテンツ作成", "Create full presentation content"),
+    "design_presentation": ("プレゼンテーションデザイン", "Design presentation styling"),
+    "analyze_and_visualize": ("チャート生成", "Generate charts from data"),
+    "build_presentation": ("PowerPoint生成", "Generate PowerPoint file"),
+    "generate_speaker_notes": ("スピーカーノート生成", "Generate speaker notes"),
+}
+
+
+# Loops running with the eager task factory -> number of pipelines using it
+_eager_loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+
+
+@contextlib.contextmanager
+def _eager_tasks():
+    """
+    Use the eager task factory (Python 3.12+) on the running loop while a
+    pipeline runs, so tasks that finish without blocking skip a scheduler
+    round trip. The loop's factory is reset once the last concurrent
+    pipeline on it finishes; a factory installed by the application is
+    left alone.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    loop = asyncio.get_running_loop()
+    if factory is None or (loop not in _eager_loops and loop.get_task_factory() is not None):
+        yield
+        return
+
+    if loop not in _eager_loops:
+        loop.set_task_factory(factory)
+        _eager_loops[loop] = 0
+    _eager_loops[loop] += 1
+    try:
+        yield
+    finally:
+        _eager_loops[loop] -= 1
+        if not _eager_loops[loop]:
+            del _eager_loops[loop]
+            if loop.get_task_factory() is factory:
+                loop.set_task_factory(None)
+
+
+class PhaseError(Exception):
+    """A create_presentation phase failed"""
+
+    def __init__(self, phase: str, error: Exception):
+        super().__init__(f"{phase}: {error}")
+        self.phase = phase
+        self.error = error
 
 
 class ExecutionMode(Enum):
@@ -33,6 +109,38 @@ class ExecutionMode(Enum):
     ADAPTIVE = "adaptive"      # Automatically choose based on task
 
 
+@dataclass(slots=True)
+class PipelineResults:
+    """Per-run outputs of each create_presentation phase"""
+    research: Optional[Dict] = None
+    insights: Optional[List] = None
+    outline: Optional[Dict] = None
+    content: Optional[Dict] = None
+    design: Optional[Dict] = None
+    charts: Optional[Dict] = None
+    build: Optional[Dict] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view (for partial_results on failure)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(frozen=True, slots=True)
+class _TemplatePlan:
+    """A presentation template resolved once, applied per create_from_template call"""
+    template_name: str
+    display_name: str
+    default_theme: str
+
+    def apply(self, requirements: Dict) -> Dict:
+        """Fill the template's defaults into a copy of ``requirements``"""
+        return {
+            **requirements,
+            "presentation_type": self.template_name,
+            "theme": requirements.get("theme", self.default_theme),
+        }
+
+
 class CEOAgent(BaseAgent):
     """
     CEO Agent: The Orchestrator that coordinates all other agents.
@@ -47,12 +155,23 @@ class CEOAgent(BaseAgent):
     - Integrate LLM for AI-powered content generation
     """
 
+    # Sub-agent constructors, keyed as in self.agents (each takes output_dir)
+    AGENT_FACTORIES: Tuple[Tuple[str, Callable[[str], BaseAgent]], ...] = (
+        ("research", lambda output_dir: ResearchAgent()),
+        ("content", lambda output_dir: ContentAgent()),
+        ("design", lambda output_dir: DesignAgent()),
+        ("builder", lambda output_dir: BuilderAgent(output_dir=output_dir)),
+        ("chart", lambda output_dir: ChartAgent(output_dir=f"{output_dir}/charts")),
+    )
+
     def __init__(
         self,
         output_dir: str = "output",
         execution_mode: ExecutionMode = ExecutionMode.ADAPTIVE,
         use_llm: bool = True,
         llm_api_key: Optional[str] = None,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
     ):
         super().__init__(
             name="CEOAgent",
@@ -64,62 +183,149 @@ class CEOAgent(BaseAgent):
         self.execution_mode = execution_mode
         self.use_llm = use_llm
 
-        # Initialize sub-agents
-        self.research_agent = ResearchAgent()
-        self.content_agent = ContentAgent()
-        self.design_agent = DesignAgent()
-        self.builder_agent = BuilderAgent(output_dir=output_dir)
-        self.chart_agent = ChartAgent(output_dir=f"{output_dir}/charts")
+        # Initialize and track sub-agents
+        self.agents: Dict[str, BaseAgent] = {
+            key: factory(output_dir) for key, factory in self.AGENT_FACTORIES
+        }
+        self.research_agent = self.agents["research"]
+        self.content_agent = self.agents["content"]
+        self.design_agent = self.agents["design"]
+        self.builder_agent = self.agents["builder"]
+        self.chart_agent = self.agents["chart"]
 
         # LLM Agent (optional)
         self.llm_agent = None
         if use_llm:
             self.llm_agent = LLMAgent(api_key=llm_api_key)
-
-        # Track all agents
-        self.agents = {
-            "research": self.research_agent,
-            "content": self.content_agent,
-            "design": self.design_agent,
-            "builder": self.builder_agent,
-            "chart": self.chart_agent,
-        }
-        if self.llm_agent:
             self.agents["llm"] = self.llm_agent
 
         # Template manager
         self.template_manager = PresentationTemplate()
 
-        # Current workflow
-        self.workflow: Optional[Workflow] = None
+        # Current workflow (reset at the start of each presentation)
+        self.workflow = Workflow(name="")
 
         # Project context
         self.project_context: Dict = {}
 
-        # Event hooks
-        self.hooks: Dict[str, List[Callable]] = {
-            "on_phase_start": [],
-            "on_phase_complete": [],
-            "on_task_complete": [],
-            "on_error": [],
-        }
+        # One thread pool for all blocking work (file parsing, slide
+        # population), shared with the sub-agents so the pipeline has a
+        # single concurrency budget. At least two workers: a research task
+        # running on the pool waits on per-sheet work queued to the same pool.
+        pool_size = int(os.getenv("NEXPRO_POOL", DEFAULT_POOL_WORKERS))
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(2, pool_size), thread_name_prefix="ceo"
+        )
+        for agent in self.agents.values():
+            agent.executor = self._pool
+
+        # Optionally pay one-time library start-up costs in the background
+        if os.getenv("NEXPRO_WARMUP") == "1":
+            threading.Thread(target=self._warmup, name="ceo-warmup", daemon=True).start()
+
+        # Sequential task IDs (cheaper than uuid4 and collision-free)
+        self._task_seq = itertools.count(1)
+
+        # Memoized pipeline results (whole runs and individual phases)
+        self.pipeline_cache: Optional[PipelineCache] = None
+        if use_cache:
+            self.pipeline_cache = PipelineCache(cache_dir or f"{output_dir}/.cache")
+            self.research_agent.cache_dir = self.pipeline_cache.cache_dir / "frames"
+
+        # Fused research results per (data file, topic) and data file digests,
+        # keyed by _file_key()
+        self._research_cache: Dict[tuple, Dict] = {}
+        self._digest_cache: Dict[tuple, str] = {}
+
+        # Resolved templates by name (None for unknown names)
+        self._template_plans: Dict[str, Optional[_TemplatePlan]] = {}
+
+        # In-process LRU of sub-task results keyed by (agent, input_data)
+        self._subtask_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+        # Summary table prototype (see _new_summary_table) and the table
+        # shown live while a pipeline runs
+        self._summary_table_proto: Optional[Table] = None
+        self._summary_table: Optional[Table] = None
+
+        # Event hooks, split by kind at registration time
+        self._sync_hooks: Dict[str, List[Callable]] = {event: [] for event in HOOK_EVENTS}
+        self._async_hooks: Dict[str, List[Callable]] = {event: [] for event in HOOK_EVENTS}
+
+    @staticmethod
+    def _warmup():
+        """Import lazily-loaded libraries and prime chart/template caches"""
+        import pandas  # noqa: F401  (ResearchAgent imports it on first use)
+        try:
+            import openpyxl  # noqa: F401  (pandas imports it on first read_excel)
+        except ImportError:
+            pass
+        ChartAgent.warm_up()
+        BuilderAgent.warm_up()
+
+    def _new_task_id(self) -> str:
+        """Next task ID for this orchestrator"""
+        return format(next(self._task_seq), "08x")
+
+    def _new_task(self, task_type: str, **fields: Any) -> Task:
+        """Build a Task for an agent task type from _TASK_TEMPLATES"""
+        name, description = _TASK_TEMPLATES[task_type]
+        return Task(
+            id=self._new_task_id(),
+            name=name,
+            description=description.format(**fields),
+            input_data={"type": task_type, **fields},
+        )
+
+    def close(self):
+        """Release the shared thread pool"""
+        self._pool.shutdown(wait=False)
+
+    def __enter__(self) -> "CEOAgent":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def log(self, message: str, style: str = ""):
         """Override log with CEO styling"""
-        console.print(f"[bold magenta][CEO][/bold magenta] {message}", style=style)
+        emit_log(Text.from_markup(f"[bold magenta][CEO][/bold magenta] {message}", style=style))
 
     def register_hook(self, event: str, callback: Callable):
         """Register a hook for an event"""
-        if event in self.hooks:
-            self.hooks[event].append(callback)
+        if event not in self._sync_hooks:
+            return
+        if asyncio.iscoroutinefunction(callback):
+            self._async_hooks[event].append(callback)
+        else:
+            self._sync_hooks[event].append(callback)
 
     async def _trigger_hooks(self, event: str, **kwargs):
-        """Trigger all hooks for an event"""
-        for callback in self.hooks.get(event, []):
-            if asyncio.iscoroutinefunction(callback):
-                await callback(**kwargs)
-            else:
+        """
+        Trigger all hooks for an event. Sync hooks run inline, coroutine
+        hooks run concurrently; a failing hook is logged, not raised.
+        """
+        for callback in self._sync_hooks.get(event, ()):
+            try:
                 callback(**kwargs)
+            except Exception as e:
+                self._log_hook_error(event, callback, e)
+
+        coro_hooks = self._async_hooks.get(event)
+        if not coro_hooks:
+            return
+
+        results = await asyncio.gather(
+            *(callback(**kwargs) for callback in coro_hooks), return_exceptions=True
+        )
+        for callback, result in zip(coro_hooks, results):
+            if isinstance(result, Exception):
+                self._log_hook_error(event, callback, result)
+
+    def _log_hook_error(self, event: str, callback: Callable, error: Exception):
+        """Report a hook failure without interrupting the pipeline"""
+        name = getattr(callback, "__qualname__", repr(callback))
+        self.log(f"⚠️ フック {name} ({event}) でエラーが発生しました: {error}", "yellow")
 
     async def execute_task(self, task: Task) -> Any:
         """Execute orchestration tasks"""
@@ -144,6 +350,14 @@ class CEOAgent(BaseAgent):
         3. Design Phase: Apply visual design and layouts
         4. Build Phase: Generate the actual PowerPoint file
         """
+        try:
+            with _eager_tasks():
+                return await self._create_presentation(requirements)
+        finally:
+            flush_logs()
+
+    async def _create_presentation(self, requirements: Dict) -> Dict:
+        """Run the create_presentation pipeline (log output is queued)"""
         topic = requirements.get("topic", "Presentation")
         data_file = requirements.get("data_file")
         theme = requirements.get("theme", "corporate")
@@ -154,100 +368,177 @@ class CEOAgent(BaseAgent):
         # Display project start
         self._show_project_start(topic, data_file, theme, output_filename)
 
+        cache_keys: Dict[str, str] = {}
+        if self.pipeline_cache is not None and requirements.get("use_cache", True):
+            cache_keys = self._pipeline_cache_keys(requirements)
+            cached = self._reuse_cached_presentation(cache_keys.get("presentation"), output_filename)
+            if cached is not None:
+                return cached
+
         # Initialize workflow
-        self.workflow = Workflow(
+        self.workflow.reset(
             name=f"Presentation: {topic}",
             description=f"Create presentation about {topic}"
         )
 
-        results = {
-            "research": None,
-            "insights": None,
-            "outline": None,
-            "content": None,
-            "design": None,
-            "charts": None,
-            "build": None,
-        }
-
-        try:
-            # ============================================
-            # Phase 1: Research
-            # ============================================
-            await self._trigger_hooks("on_phase_start", phase="research")
-            self.log("📊 Phase 1: リサーチフェーズを開始します")
-
-            results["research"], results["insights"] = await self._execute_research_phase(
-                data_file, topic
-            )
-
-            await self._trigger_hooks("on_phase_complete", phase="research", results=results["research"])
-            self._show_phase_complete("Research", "✅")
-
-            # ============================================
-            # Phase 2: Content Creation (with optional LLM)
-            # ============================================
-            await self._trigger_hooks("on_phase_start", phase="content")
-            self.log("📝 Phase 2: コンテンツ作成フェーズを開始します")
-
-            results["outline"], results["content"] = await self._execute_content_phase(
-                topic, results, requirements, presentation_type
-            )
-
-            await self._trigger_hooks("on_phase_complete", phase="content", results=results["content"])
-            self._show_phase_complete("Content", "✅")
-
-            # ============================================
-            # Phase 3: Design & Charts (Parallel)
-            # ============================================
-            await self._trigger_hooks("on_phase_start", phase="design")
-            self.log("🎨 Phase 3: デザイン＆チャートフェーズを開始します")
-
-            if self.execution_mode in [ExecutionMode.PARALLEL, ExecutionMode.ADAPTIVE]:
-                # Run design and chart generation in parallel
-                design_coro = self._execute_design_phase(results["content"], theme)
-                chart_coro = self._execute_chart_phase(results["research"], include_charts)
-
-                design_result, charts_result = await asyncio.gather(
-                    design_coro, chart_coro, return_exceptions=True
+        results = PipelineResults()
+        parallel = self.execution_mode in [ExecutionMode.PARALLEL, ExecutionMode.ADAPTIVE]
+
+        # ============================================
+        # Phase 1: Research
+        # ============================================
+        async def research_phase(_):
+            async with self._phase("Research"):
+                await self._trigger_hooks("on_phase_start", phase="research")
+
+                if not data_file:
+                    results.research, results.insights = None, []
+                    await self._trigger_hooks("on_phase_complete", phase="research", results=None)
+                    self._show_phase_complete("Research", "⏭️ スキップ", "データファイルなし")
+                    return
+
+                self.log("📊 Phase 1: リサーチフェーズを開始します")
+
+                cached = self._cache_get(cache_keys.get("research"))
+                if cached is not None:
+                    self.log("♻️ キャッシュ済みのリサーチ結果を再利用します")
+                    results.research, results.insights = cached
+                else:
+                    results.research, results.insights = await self._execute_research_phase(
+                        data_file, topic
+                    )
+                    self._cache_set(cache_keys.get("research"), (results.research, results.insights))
+
+                await self._trigger_hooks("on_phase_complete", phase="research", results=results.research)
+                sheets = (results.research or {}).get("summary", {}).get("total_sheets", 0)
+                self._show_phase_complete("Research", "✅ 完了", f"{sheets} シート分析済み")
+
+        # ============================================
+        # Phase 2: Content Creation (with optional LLM)
+        # ============================================
+        async def content_phase(_):
+            async with self._phase("Content"):
+                await self._trigger_hooks("on_phase_start", phase="content")
+                self.log("📝 Phase 2: コンテンツ作成フェーズを開始します")
+
+                if cache_keys:
+                    cache_keys.update(self._content_cache_keys(requirements, results))
+                cached = self._cache_get(cache_keys.get("content"))
+                if cached is not None:
+                    self.log("♻️ キャッシュ済みのコンテンツを再利用します")
+                    results.outline, results.content = cached
+                else:
+                    results.outline, results.content = await self._execute_content_phase(
+                        topic, results, requirements, presentation_type
+                    )
+                    # Offline fallback content (the LLM call failed) would
+                    # otherwise be replayed under the online LLM key
+                    if not self._used_fallback(results.content):
+                        self._cache_set(cache_keys.get("content"), (results.outline, results.content))
+
+                await self._trigger_hooks("on_phase_complete", phase="content", results=results.content)
+                slides = len((results.content or {}).get("slides", []))
+                self._show_phase_complete("Content", "✅ 完了", f"{slides} スライド作成")
+
+        # ============================================
+        # Phase 3: Design & Charts
+        # ============================================
+        # Charts only depend on the research data, so in parallel modes they
+        # overlap the content and design phases; a failure there (or in
+        # design) leaves that result empty instead of aborting the build
+        async def design_phase(_):
+            async with self._phase("Design"):
+                await self._trigger_hooks("on_phase_start", phase="design")
+                self.log("🎨 Phase 3: デザイン＆チャートフェーズを開始します")
+                try:
+                    results.design = await self._cached_design_phase(
+                        cache_keys.get("design"), results.content, theme
+                    )
+                except Exception:
+                    if not parallel:
+                        raise
+                    results.design = None
+
+        async def chart_phase(_):
+            async with self._phase("Charts"):
+                try:
+                    results.charts = await self._execute_chart_phase(results.research, include_charts)
+                except Exception:
+                    if not parallel:
+                        raise
+                    results.charts = None
+
+        # ============================================
+        # Phase 4: Build
+        # ============================================
+        async def build_phase(_):
+            async with self._phase("Build"):
+                await self._trigger_hooks("on_phase_complete", phase="design", results=results.design)
+                if results.design:
+                    theme_name = results.design.get("theme", {}).get("name", "default")
+                    self._show_phase_complete("Design", "✅ 完了", f"テーマ: {theme_name}")
+                if results.charts:
+                    chart_count = results.charts.get("count", 0)
+                    self._show_phase_complete("Charts", "✅ 完了", f"{chart_count} チャート生成")
+
+                await self._trigger_hooks("on_phase_start", phase="build")
+                self.log("🔨 Phase 4: ビルドフェーズを開始します")
+
+                results.build = await self._execute_build_phase(
+                    results.content,
+                    results.design,
+                    results.charts,
+                    output_filename
                 )
 
-                results["design"] = design_result if not isinstance(design_result, Exception) else None
-                results["charts"] = charts_result if not isinstance(charts_result, Exception) else None
-            else:
-                results["design"] = await self._execute_design_phase(results["content"], theme)
-                results["charts"] = await self._execute_chart_phase(results["research"], include_charts)
-
-            await self._trigger_hooks("on_phase_complete", phase="design", results=results["design"])
-            self._show_phase_complete("Design & Charts", "✅")
-
-            # ============================================
-            # Phase 4: Build
-            # ============================================
-            await self._trigger_hooks("on_phase_start", phase="build")
-            self.log("🔨 Phase 4: ビルドフェーズを開始します")
-
-            results["build"] = await self._execute_build_phase(
-                results["content"],
-                results["design"],
-                results.get("charts"),
-                output_filename
-            )
-
-            await self._trigger_hooks("on_phase_complete", phase="build", results=results["build"])
-            self._show_phase_complete("Build", "✅")
+                await self._trigger_hooks("on_phase_complete", phase="build", results=results.build)
+                file_path = (results.build or {}).get("file_path", "")
+                self._show_phase_complete("Build", "✅ 完了", f"出力: {file_path}")
+
+        engine = WorkflowEngine(max_concurrency=None if parallel else 1)
+        nodes = [
+            Node("research", research_phase),
+            Node("content", content_phase, deps=("research",)),
+            Node("design", design_phase, deps=("content",)),
+        ]
+        # Without a data file there is no research data to chart, so the
+        # chart node is left out entirely rather than scheduled as a no-op
+        if include_charts and data_file:
+            nodes.append(Node("charts", chart_phase, deps=("research",)))
+            nodes.append(Node("build", build_phase, deps=("design", "charts")))
+        else:
+            results.charts = {"charts": [], "count": 0}
+            nodes.append(Node("build", build_phase, deps=("design",)))
 
-            # ============================================
-            # Final Summary
-            # ============================================
-            self._show_final_summary(results)
+        try:
+            with self._live_summary():
+                await engine.run(nodes)
 
-            return {
+            final_result = {
                 "success": True,
-                "file_path": results["build"].get("file_path"),
-                "slide_count": results["build"].get("slide_count"),
+                "file_path": results.build.get("file_path"),
+                "slide_count": results.build.get("slide_count"),
                 "phases_completed": ["research", "content", "design", "build"],
-                "charts_generated": len(results.get("charts", {}).get("charts", [])) if results.get("charts") else 0,
+                "charts_generated": len(results.charts.get("charts", [])) if results.charts else 0,
+            }
+            # A deck built without its design or charts (a phase that failed
+            # in parallel mode) or from LLM fallback content is returned but
+            # not replayed for later runs
+            if (
+                results.design is not None
+                and results.charts is not None
+                and not self._used_fallback(results.content)
+            ):
+                self._remember_presentation(cache_keys.get("presentation"), final_result)
+            return final_result
+
+        except PhaseError as e:
+            await self._trigger_hooks("on_error", error=str(e.error))
+            return {
+                "success": False,
+                "error": str(e.error),
+                "failed_phase": e.phase,
+                "partial_results": results.to_dict(),
             }
 
         except Exception as e:
@@ -256,66 +547,219 @@ class CEOAgent(BaseAgent):
             return {
                 "success": False,
                 "error": str(e),
-                "partial_results": results,
+                "partial_results": results.to_dict(),
             }
 
-    async def _execute_research_phase(self, data_file: Optional[str], topic: str) -> tuple:
-        """Execute research phase"""
-        research_result = None
-        insights_result = None
+    @contextlib.asynccontextmanager
+    async def _phase(self, name: str):
+        """Attribute any failure inside a pipeline phase to that phase"""
+        try:
+            yield
+        except PhaseError:
+            raise
+        except Exception as e:
+            self.log(f"❌ {name} フェーズでエラーが発生しました: {e}", "red")
+            raise PhaseError(name, e) from e
 
+    def _pipeline_cache_keys(self, requirements: Dict) -> Dict[str, str]:
+        """
+        Keys known before the pipeline runs: research (data file contents)
+        and the whole presentation (research key plus every requirement
+        that shapes the output). Content and design keys are derived from
+        the research results once they exist (see _content_cache_keys).
+        """
+        data_file = requirements.get("data_file")
+        file_digest = None
         if data_file:
-            # Read and analyze data file
-            research_task = Task(
-                id=str(uuid.uuid4())[:8],
-                name="データ分析",
-                description=f"Analyze data from {data_file}",
-                input_data={
-                    "type": "read_excel" if data_file.endswith(('.xlsx', '.xls')) else "read_csv",
-                    "file_path": data_file,
-                }
+            file_digest = self._file_digest(data_file)
+            if file_digest is None:
+                # Unreadable data file: let the pipeline report the error
+                return {}
+        research_key = self.pipeline_cache.make_key("research", file_digest)
+        presentation_key = self.pipeline_cache.make_key(
+            "presentation",
+            research_key,
+            self._content_params(requirements),
+            requirements.get("theme", "corporate"),
+            requirements.get("include_charts", True),
+        )
+        keys = {"presentation": presentation_key}
+        if data_file:
+            keys["research"] = research_key
+        return keys
+
+    def _content_cache_keys(self, requirements: Dict, results: "PipelineResults") -> Dict[str, str]:
+        """
+        Content-addressed keys for the content and design phases: a hash of
+        the research output rather than of its inputs, so any run that
+        yields the same research data reuses the same content (e.g. an
+        edited spreadsheet whose analyzed sample did not change).
+        """
+        content_key = self.pipeline_cache.make_key(
+            "content",
+            hash_input((results.research, results.insights), digest_size=32),
+            self._content_params(requirements),
+        )
+        design_key = self.pipeline_cache.make_key(
+            "design", content_key, requirements.get("theme", "corporate")
+        )
+        return {"content": content_key, "design": design_key}
+
+    def _content_params(self, requirements: Dict) -> tuple:
+        """Requirements (and LLM mode) that shape the generated content"""
+        llm_mode = None
+        if self.llm_agent and self.use_llm:
+            llm_mode = (self.llm_agent.model, self.llm_agent.client is not None)
+        return (
+            requirements.get("topic", "Presentation"),
+            requirements.get("num_slides", 5),
+            requirements.get("presentation_type"),
+            requirements.get("audience", "ビジネスプロフェッショナル"),
+            requirements.get("tone", "professional"),
+            llm_mode,
+        )
+
+    @staticmethod
+    def _file_key(path: str) -> Optional[tuple]:
+        """Identity of a file's current contents (None if it cannot be read)"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    def _file_digest(self, path: str) -> Optional[str]:
+        """SHA-256 of a data file, recomputed only when the file changes"""
+        key = self._file_key(path)
+        if key is None:
+            return None
+        digest = self._digest_cache.get(key)
+        if digest is None:
+            digest = self._digest_cache[key] = PipelineCache.file_digest(path)
+        return digest
+
+    @staticmethod
+    def _used_fallback(result: Any) -> bool:
+        """Whether an LLM result was built from offline fallback output"""
+        return isinstance(result, dict) and bool(result.get(FALLBACK_FLAG))
+
+    def _cache_get(self, key: Optional[str]) -> Any:
+        """Look up a phase result (None when caching is off or on a miss)"""
+        if key is None or self.pipeline_cache is None:
+            return None
+        return self.pipeline_cache.get(key)
+
+    def _cache_set(self, key: Optional[str], value: Any):
+        """Store a phase result when caching is enabled"""
+        if key is not None and self.pipeline_cache is not None:
+            self.pipeline_cache.set(key, value)
+
+    def _remember_presentation(self, key: Optional[str], result: Dict):
+        """Cache a finished run with the digest of the deck it wrote"""
+        if key is None or self.pipeline_cache is None or not result.get("file_path"):
+            return
+        digest = self._file_digest(result["file_path"])
+        if digest is not None:
+            self._cache_set(key, (result, digest))
+
+    def _reuse_cached_presentation(self, key: Optional[str], output_filename: str) -> Optional[Dict]:
+        """Return a previous identical run's result, copying its file if needed"""
+        entry = self._cache_get(key)
+        if not isinstance(entry, tuple):
+            return None
+        cached, digest = entry
+
+        # The deck may have been overwritten (e.g. by a run with another
+        # topic to the same filename) since it was cached
+        source = Path(cached["file_path"])
+        if self._file_digest(str(source)) != digest:
+            return None
+
+        target = self.builder_agent.output_dir / output_filename
+        if source.resolve() != target.resolve():
+            shutil.copyfile(source, target)
+
+        self.log("♻️ 同一条件の生成結果を再利用します")
+        return {**cached, "file_path": str(target), "cached": True}
+
+    async def _cached_design_phase(self, key: Optional[str], content: Dict, theme: str) -> Dict:
+        """Design phase with phase-level memoization"""
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.log("♻️ キャッシュ済みのデザインを再利用します")
+            return cached
+        design = await self._execute_design_phase(content, theme)
+        self._cache_set(key, design)
+        return design
+
+    async def _run_off_loop(
+        self,
+        agent: BaseAgent,
+        task: Task,
+        pool: Optional[concurrent.futures.Executor] = None,
+    ) -> Any:
+        """Run a blocking agent task in an executor so the event loop stays free"""
+        return await asyncio.get_running_loop().run_in_executor(pool, agent.run_sync, task)
+
+    async def _cached_run(
+        self,
+        agent_key: str,
+        agent: BaseAgent,
+        task: Task,
+        pool: Optional[concurrent.futures.Executor] = None,
+    ) -> Any:
+        """
+        Run a side-effect free sub-task, reusing the result of an earlier
+        task with identical input_data. Builder/chart tasks write files and
+        must not go through here. With ``pool`` the task runs off the loop.
+        """
+        key = f"{agent_key}:{hash_input(task.input_data)}"
+        # Content-derived ID: a repeated input shows up with the same ID in logs
+        task.id = key
+        if key in self._subtask_cache:
+            self._subtask_cache.move_to_end(key)
+            return copy.deepcopy(self._subtask_cache[key])
+
+        if pool is not None:
+            result = await self._run_off_loop(agent, task, pool)
+        else:
+            [result] = await agent.run_batch([task])
+
+        # Failed results and LLM fallback output are retried next time
+        failed = isinstance(result, dict) and result.get("success") is False
+        if not failed and not self._used_fallback(result):
+            self._subtask_cache[key] = copy.deepcopy(result)
+            if len(self._subtask_cache) > SUBTASK_CACHE_SIZE:
+                self._subtask_cache.popitem(last=False)
+        return result
+
+    async def _execute_research_phase(self, data_file: Optional[str], topic: str) -> tuple:
+        """Execute research phase"""
+        if not data_file:
+            return None, []
+
+        # Read, analyze and extract insights as one fused task on a worker
+        # thread, reusing the bundle while the file is unchanged
+        file_key = self._file_key(data_file)
+        bundle = self._research_cache.get((file_key, topic))
+        if bundle is None:
+            research_task = self._new_task(
+                "analyze_and_extract",
+                file_path=data_file,
+                context=topic,
             )
-            self.research_agent.receive_task(research_task)
-            research_result = await self.research_agent.run()
-
-            # Extract insights
-            if research_result:
-                sheets = research_result.get("sheets", {})
-                if sheets:
-                    first_sheet_name = list(sheets.keys())[0]
-                    sample_data = sheets[first_sheet_name].get("sample", {})
-
-                    insight_task = Task(
-                        id=str(uuid.uuid4())[:8],
-                        name="インサイト抽出",
-                        description="Extract insights from analyzed data",
-                        input_data={
-                            "type": "analyze_data",
-                            "data": sample_data,
-                        }
-                    )
-                    self.research_agent.receive_task(insight_task)
-                    analysis = await self.research_agent.run()
-
-                    insight_extract_task = Task(
-                        id=str(uuid.uuid4())[:8],
-                        name="インサイト整理",
-                        description="Organize insights",
-                        input_data={
-                            "type": "extract_insights",
-                            "analysis": analysis,
-                            "context": topic,
-                        }
-                    )
-                    self.research_agent.receive_task(insight_extract_task)
-                    insights_result = await self.research_agent.run()
+            bundle = await self._run_off_loop(self.research_agent, research_task, self._pool)
+            if file_key is not None:
+                self._research_cache[(file_key, topic)] = bundle
+        else:
+            self.log(f"♻️ 読み込み済みのデータを再利用します: {data_file}")
 
-        return research_result, insights_result
+        return bundle["research"], bundle["insights"]
 
     async def _execute_content_phase(
         self,
         topic: str,
-        results: Dict,
+        results: "PipelineResults",
         requirements: Dict,
         presentation_type: Optional[str]
     ) -> tuple:
@@ -325,21 +769,15 @@ class CEOAgent(BaseAgent):
         if self.llm_agent and self.use_llm:
             self.log("🤖 LLM Agentを使用してコンテンツを生成します")
 
-            llm_task = Task(
-                id=str(uuid.uuid4())[:8],
-                name="AIコンテンツ生成",
-                description="Generate content using AI",
-                input_data={
-                    "type": "generate_content",
-                    "topic": topic,
-                    "context": str(results.get("insights", [])),
-                    "audience": requirements.get("audience", "ビジネスプロフェッショナル"),
-                    "tone": requirements.get("tone", "professional"),
-                    "num_slides": requirements.get("num_slides", 5),
-                }
+            llm_task = self._new_task(
+                "generate_content",
+                topic=topic,
+                context=dumps(results.insights or []),
+                audience=requirements.get("audience", "ビジネスプロフェッショナル"),
+                tone=requirements.get("tone", "professional"),
+                num_slides=requirements.get("num_slides", 5),
             )
-            self.llm_agent.receive_task(llm_task)
-            content_result = await self.llm_agent.run()
+            content_result = await self._cached_run("llm", self.llm_agent, llm_task)
 
             outline_result = {
                 "title": topic,
@@ -350,57 +788,39 @@ class CEOAgent(BaseAgent):
 
         # Use template-based content generation
         if presentation_type:
-            ptype = self.template_manager.get_presentation_type(presentation_type)
-            if ptype:
-                self.log(f"📋 テンプレート「{ptype['name']}」を使用します")
+            plan = self._template_plan(presentation_type)
+            if plan:
+                self.log(f"📋 テンプレート「{plan.display_name}」を使用します")
 
         # Create outline
-        outline_task = Task(
-            id=str(uuid.uuid4())[:8],
-            name="アウトライン作成",
-            description="Create presentation outline",
-            input_data={
-                "type": "create_outline",
-                "topic": topic,
-                "insights": results.get("insights", []),
-                "num_slides": requirements.get("num_slides", 5),
-                "presentation_type": presentation_type,
-            }
+        outline_task = self._new_task(
+            "create_outline",
+            topic=topic,
+            insights=results.insights,
+            num_slides=requirements.get("num_slides", 5),
+            presentation_type=presentation_type,
         )
-        self.content_agent.receive_task(outline_task)
-        outline_result = await self.content_agent.run()
+        outline_result = await self._cached_run("content", self.content_agent, outline_task)
 
         # Create full content
-        content_task = Task(
-            id=str(uuid.uuid4())[:8],
-            name="コンテンツ作成",
-            description="Create full presentation content",
-            input_data={
-                "type": "create_full_content",
-                "outline": outline_result,
-                "research_data": results.get("research", {}),
-                "insights": results.get("insights", []),
-            }
+        content_task = self._new_task(
+            "create_full_content",
+            outline=outline_result,
+            research_data=results.research,
+            insights=results.insights,
         )
-        self.content_agent.receive_task(content_task)
-        content_result = await self.content_agent.run()
+        content_result = await self._cached_run("content", self.content_agent, content_task)
 
         return outline_result, content_result
 
     async def _execute_design_phase(self, content: Dict, theme: str) -> Dict:
         """Execute design phase"""
-        design_task = Task(
-            id=str(uuid.uuid4())[:8],
-            name="プレゼンテーションデザイン",
-            description="Design presentation styling",
-            input_data={
-                "type": "design_presentation",
-                "content": content,
-                "theme": theme,
-            }
+        design_task = self._new_task(
+            "design_presentation",
+            content=content,
+            theme=theme,
         )
-        self.design_agent.receive_task(design_task)
-        return await self.design_agent.run()
+        return await self._cached_run("design", self.design_agent, design_task)
 
     async def _execute_chart_phase(self, research_data: Optional[Dict], include_charts: bool) -> Dict:
         """Execute chart generation phase"""
@@ -409,15 +829,10 @@ class CEOAgent(BaseAgent):
 
         self.log("📈 チャートを生成中...")
 
-        chart_task = Task(
-            id=str(uuid.uuid4())[:8],
-            name="チャート生成",
-            description="Generate charts from data",
-            input_data={
-                "type": "analyze_and_visualize",
-                "data": research_data.get("sheets", {}),
-                "title": "データ分析",
-            }
+        chart_task = self._new_task(
+            "analyze_and_visualize",
+            data=research_data.get("sheets", {}),
+            title="データ分析",
         )
         self.chart_agent.receive_task(chart_task)
         return await self.chart_agent.run()
@@ -430,17 +845,12 @@ class CEOAgent(BaseAgent):
         filename: str
     ) -> Dict:
         """Execute build phase"""
-        build_task = Task(
-            id=str(uuid.uuid4())[:8],
-            name="PowerPoint生成",
-            description="Generate PowerPoint file",
-            input_data={
-                "type": "build_presentation",
-                "content": content,
-                "design": design,
-                "charts": charts,
-                "filename": filename,
-            }
+        build_task = self._new_task(
+            "build_presentation",
+            content=content,
+            design=design,
+            charts=charts,
+            filename=filename,
         )
         self.builder_agent.receive_task(build_task)
         return await self.builder_agent.run()
@@ -464,17 +874,11 @@ class CEOAgent(BaseAgent):
         # Generate speaker notes if requested
         if requirements.get("generate_speaker_notes") and self.llm_agent:
             self.log("📝 スピーカーノートを生成中...")
-            notes_task = Task(
-                id=str(uuid.uuid4())[:8],
-                name="スピーカーノート生成",
-                description="Generate speaker notes",
-                input_data={
-                    "type": "generate_speaker_notes",
-                    "slides": base_result.get("content", {}).get("slides", []),
-                }
+            notes_task = self._new_task(
+                "generate_speaker_notes",
+                slides=base_result.get("content", {}).get("slides", []),
             )
-            self.llm_agent.receive_task(notes_task)
-            await self.llm_agent.run()
+            await self.llm_agent.run_batch([notes_task])
 
         return base_result
 
@@ -482,27 +886,31 @@ class CEOAgent(BaseAgent):
         """Create presentation from a predefined template"""
         template_name = requirements.get("template", "business_proposal")
 
-        template = self.template_manager.get_presentation_type(template_name)
-        if not template:
+        plan = self._template_plan(template_name)
+        if not plan:
             return {"success": False, "error": f"Template not found: {template_name}"}
 
-        self.log(f"📋 テンプレート「{template['name']}」から作成します")
+        self.log(f"📋 テンプレート「{plan.display_name}」から作成します")
 
-        # Merge template requirements with user requirements
-        merged_requirements = {
-            **requirements,
-            "presentation_type": template_name,
-            "theme": requirements.get("theme", template.get("recommended_theme", "corporate")),
-        }
+        return await self.create_presentation(plan.apply(requirements))
 
-        return await self.create_presentation(merged_requirements)
+    def _template_plan(self, template_name: str) -> Optional[_TemplatePlan]:
+        """Look up a template once and keep its resolved plan"""
+        if template_name not in self._template_plans:
+            template = self.template_manager.get_presentation_type(template_name)
+            self._template_plans[template_name] = _TemplatePlan(
+                template_name=template_name,
+                display_name=template["name"],
+                default_theme=template.get("recommended_theme", "corporate"),
+            ) if template else None
+        return self._template_plans[template_name]
 
     def _show_project_start(self, topic: str, data_file: Optional[str], theme: str, filename: str):
         """Display project start panel"""
         mode_str = f"実行モード: {self.execution_mode.value}"
         llm_str = "LLM: 有効" if self.use_llm and self.llm_agent else "LLM: 無効"
 
-        console.print(Panel(
+        emit_log(Panel(
             f"[bold]プロジェクト開始[/bold]\n\n"
             f"トピック: {topic}\n"
             f"データファイル: {data_file or 'なし'}\n"
@@ -514,54 +922,67 @@ class CEOAgent(BaseAgent):
             border_style="magenta"
         ))
 
-    def _show_phase_complete(self, phase_name: str, status: str):
-        """Show phase completion status"""
-        console.print(f"  {status} {phase_name} フェーズ完了")
-
-    def _show_final_summary(self, results: Dict):
-        """Show final project summary"""
-        table = Table(title="プロジェクト完了サマリー")
-        table.add_column("フェーズ", style="cyan")
-        table.add_column("ステータス", style="green")
-        table.add_column("詳細", style="white")
-
-        # Research
-        if results.get("research"):
-            sheets = results["research"].get("summary", {}).get("total_sheets", 0)
-            table.add_row("Research", "✅ 完了", f"{sheets} シート分析済み")
+    def _show_phase_complete(self, phase_name: str, status: str, detail: str = ""):
+        """Add a phase's row to the live summary table"""
+        if self._summary_table is not None:
+            self._summary_table.add_row(phase_name, status, detail)
         else:
-            table.add_row("Research", "⏭️ スキップ", "データファイルなし")
-
-        # Content
-        if results.get("content"):
-            slides = len(results["content"].get("slides", []))
-            table.add_row("Content", "✅ 完了", f"{slides} スライド作成")
+            emit_log(Text.from_markup(f"  {status} {phase_name}: {detail}"))
 
-        # Design
-        if results.get("design"):
-            theme = results["design"].get("theme", {}).get("name", "default")
-            table.add_row("Design", "✅ 完了", f"テーマ: {theme}")
-
-        # Charts
-        if results.get("charts"):
-            chart_count = results["charts"].get("count", 0)
-            table.add_row("Charts", "✅ 完了", f"{chart_count} チャート生成")
-
-        # Build
-        if results.get("build"):
-            file_path = results["build"].get("file_path", "")
-            table.add_row("Build", "✅ 完了", f"出力: {file_path}")
+    @contextlib.contextmanager
+    def _live_summary(self):
+        """
+        Show the phase summary table as a single live display that is
+        updated in place as phases finish; log output scrolls above it.
+        Falls back to printing the table once at the end if another live
+        display already owns the console.
+        """
+        table = self._new_summary_table()
+        self._summary_table = table
+        live = Live(table, console=get_console(), refresh_per_second=4)
+        try:
+            live.start()
+        except LiveError:
+            live = None
 
-        console.print()
-        console.print(table)
-        console.print()
+        try:
+            yield table
+        finally:
+            flush_logs()
+            if live is not None:
+                live.stop()
+                if not live.console.is_terminal:
+                    live.console.line()  # final render is not newline-terminated
+            else:
+                emit_log(Group("", table, ""))
+                flush_logs()
+            self._summary_table = None
+
+    def _new_summary_table(self) -> Table:
+        """Empty summary table cloned from a prototype built once per agent"""
+        if self._summary_table_proto is None:
+            proto = Table(title="プロジェクト完了サマリー")
+            proto.add_column("フェーズ", style="cyan")
+            proto.add_column("ステータス", style="green")
+            proto.add_column("詳細", style="white")
+            self._summary_table_proto = proto
+
+        table = copy.copy(self._summary_table_proto)
+        table.rows = []
+        table.columns = [
+            dataclasses.replace(column, _cells=[])
+            for column in self._summary_table_proto.columns
+        ]
+        return table
 
     def get_all_agent_status(self) -> Dict:
         """Get status of all agents"""
-        return {
-            name: agent.get_status()
-            for name, agent in self.agents.items()
-        }
+        return dict(self.iter_agent_status())
+
+    def iter_agent_status(self) -> Iterator[Tuple[str, Dict]]:
+        """Lazily yield (name, status) per agent, for callers that stop early"""
+        for name, agent in self.agents.items():
+            yield name, agent.get_status()
 
     def list_available_templates(self) -> List[Dict]:
         """List all available presentation templates"""
@@ -573,7 +994,7 @@ class CEOAgent(BaseAgent):
 
     async def run_interactive(self):
         """Run in interactive mode"""
-        console.print(Panel(
+        get_console().print(Panel(
             "[bold]Multi-Agent PowerPoint Orchestrator[/bold]\n\n"
             "CEOエージェントとして、複数のサブエージェントを\n"
             "統括してプレゼンテーションを自動生成します。\n\n"
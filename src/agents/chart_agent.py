@@ -1,31 +1,146 @@
 """Chart Agent - Data visualization and chart generation"""
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
+import asyncio
+import contextlib
 import io
+import os
 import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from .base_agent import BaseAgent
 from ..core.task import Task
+from ..core.pipeline_cache import hash_input
 
 # Try to import visualization libraries
 try:
     import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
     import matplotlib.font_manager as fm
+    import numpy as np  # always present alongside matplotlib
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.figure import Figure
     HAS_MATPLOTLIB = True
 except ImportError:
     HAS_MATPLOTLIB = False
 
-try:
-    import pandas as pd
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
+# Chart rcParams, applied only while charts render (see _chart_rc)
+_RC = {
+    "font.family": ["DejaVu Sans", "sans-serif"],
+    "axes.unicode_minus": False,
+}
+_rc_lock = threading.Lock()
+_rc_users = 0
+_rc_saved: Dict[str, Any] = {}
 
-# Configure Japanese font
 if HAS_MATPLOTLIB:
-    plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
-    plt.rcParams['axes.unicode_minus'] = False
+    # Resolve the chart font once so later lookups hit findfont's cache
+    fm.findfont("DejaVu Sans")
+
+
+@contextlib.contextmanager
+def _chart_rc():
+    """
+    Apply _RC for the duration of a render. Renders can overlap on worker
+    threads, so the settings are installed by the first renderer in and
+    restored by the last one out (matplotlib.rc_context is not safe to
+    nest across threads).
+    """
+    global _rc_users
+    with _rc_lock:
+        if _rc_users == 0:
+            _rc_saved.update({key: matplotlib.rcParams[key] for key in _RC})
+            matplotlib.rcParams.update(_RC)
+        _rc_users += 1
+    try:
+        yield
+    finally:
+        with _rc_lock:
+            _rc_users -= 1
+            if _rc_users == 0:
+                matplotlib.rcParams.update(_rc_saved)
+                _rc_saved.clear()
+
+
+# Idle figures kept for reuse, keyed by figsize (at most FIG_POOL_SIZE
+# each; only fixed chart sizes are pooled). Figures are built with the
+# object API (not pyplot) and render through Agg via savefig.
+FIG_POOL_SIZE = 4
+_FIG_POOL: Dict[Tuple[float, float], List["Figure"]] = {}
+_FIG_POOL_LOCK = threading.Lock()
+
+# Default chart resolution, and named presets selectable with input "quality"
+CHART_DPI = 100
+QUALITY_DPI = {"thumbnail": 72, "standard": CHART_DPI, "high": 150}
+
+# Output formats selectable with input "format". PNG is the default and the
+# one to use for PowerPoint: python-pptx's add_picture cannot embed SVG.
+# SVG keeps text and shapes as vectors (no rasterization) for web/doc export.
+CHART_FORMATS = ("png", "svg")
+
+# Bump when chart styling changes so files cached by input hash are re-rendered
+CHART_STYLE_VERSION = 1
+
+# Rendered PNGs kept in memory per ChartAgent for get_chart_for_pptx
+CHART_BYTES_CACHE_SIZE = 32
+
+
+def _split_items(data: Dict) -> Tuple[List, List]:
+    """Split a dict into (keys, values) lists in one pass"""
+    if not data:
+        return [], []
+    keys, values = zip(*data.items())
+    return list(keys), list(values)
+
+
+# Bar value label formatter per value type (others use str). ".10g" drops
+# float noise such as 0.30000000000000004 without switching to exponent
+# notation for ordinary magnitudes.
+_LABEL_FORMATS: Dict[type, Callable[[Any], str]] = {float: "{:.10g}".format}
+
+
+def _value_labels(values: List) -> List[str]:
+    """Bar label text for each value"""
+    return [_LABEL_FORMATS.get(type(value), str)(value) for value in values]
+
+
+def _is_scalar(value: Any) -> bool:
+    """True for table cell values that are not a column of values"""
+    return isinstance(value, (str, bytes)) or not isinstance(value, Iterable)
+
+
+def _column_rows(columns: List) -> List[Tuple]:
+    """
+    Row tuples from column values, as pd.DataFrame(dict) would build them.
+    Columns may be sequences or {index: value} dicts (rows follow the union
+    of their keys, missing cells are blank); scalars fill every row.
+    """
+    if not columns:
+        return []
+    if any(isinstance(col, Mapping) for col in columns):
+        columns = [col if isinstance(col, Mapping) or _is_scalar(col) else dict(enumerate(col)) for col in columns]
+        index = list(dict.fromkeys(key for col in columns if isinstance(col, Mapping) for key in col))
+        return [
+            tuple(col.get(key, "") if isinstance(col, Mapping) else col for col in columns)
+            for key in index
+        ]
+
+    columns = [col if _is_scalar(col) else list(col) for col in columns]
+    lengths = {len(col) for col in columns if not _is_scalar(col)}
+    if not lengths:
+        raise ValueError("Table data needs at least one column of values, not only scalars")
+    if len(lengths) > 1:
+        raise ValueError("All table columns must be of the same length")
+    count = lengths.pop()
+    return list(zip(*(([col] * count) if _is_scalar(col) else col for col in columns)))
+
+
+def _table_rows(data: Any) -> Tuple[List, List[Tuple]]:
+    """Column labels and row tuples from dict-of-columns or list-of-records data"""
+    if isinstance(data, Mapping):
+        return list(data), _column_rows(list(data.values()))
+    columns = list(dict.fromkeys(key for record in data for key in record))
+    return columns, [tuple(record.get(col, "") for col in columns) for record in data]
 
 
 class ChartAgent(BaseAgent):
@@ -39,6 +154,17 @@ class ChartAgent(BaseAgent):
     - Export charts as images for PowerPoint
     """
 
+    __slots__ = ("output_dir", "chart_counter", "_chart_bytes", "_chart_bytes_lock")
+
+    # Log labels per chart file prefix
+    CHART_LABELS = {
+        "bar": "Bar chart",
+        "line": "Line chart",
+        "pie": "Pie chart",
+        "comparison": "Comparison chart",
+        "table": "Table image",
+    }
+
     def __init__(self, output_dir: str = "output/charts"):
         super().__init__(
             name="ChartAgent",
@@ -48,10 +174,27 @@ class ChartAgent(BaseAgent):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.chart_counter = 0
+        self._chart_bytes: "OrderedDict[str, bytes]" = OrderedDict()
+        self._chart_bytes_lock = threading.Lock()
 
         if not HAS_MATPLOTLIB:
             self.log("matplotlib not available - chart generation limited", "yellow")
 
+    @staticmethod
+    def warm_up():
+        """
+        Render a throwaway figure so font and renderer caches are built
+        ahead of the first real chart. Uses the object API (no pyplot
+        state), so it is safe to call from a background thread.
+        """
+        if not HAS_MATPLOTLIB:
+            return
+        fig = Figure(figsize=(2, 2))
+        ax = fig.subplots()
+        ax.bar(["a", "b"], [1, 2])
+        ax.set_title("warm-up", fontsize=14, fontweight='bold')
+        fig.savefig(io.BytesIO(), format="png")
+
     async def execute_task(self, task: Task) -> Any:
         """Execute chart-related tasks"""
         task_type = task.input_data.get("type", "create_chart") if task.input_data else "create_chart"
@@ -73,11 +216,72 @@ class ChartAgent(BaseAgent):
         else:
             return await self._create_chart(task.input_data)
 
-    def _get_chart_path(self, name: str = None) -> Path:
-        """Generate unique chart file path"""
+    def _get_chart_path(self, name: str = None, input_data: Optional[Dict] = None) -> Path:
+        """
+        Generate a chart file path. With ``input_data`` the name is derived
+        from a hash of the inputs, so identical requests map to the same file.
+        """
         self.chart_counter += 1
-        filename = f"{name or 'chart'}_{self.chart_counter}.png"
-        return self.output_dir / filename
+        if input_data is None:
+            return self.output_dir / f"{name or 'chart'}_{self.chart_counter}.png"
+        key = hash_input((CHART_STYLE_VERSION, name, input_data))
+        fmt = input_data.get("format", "png")
+        return self.output_dir / f"{name or 'chart'}_{key}.{fmt}"
+
+    @contextlib.contextmanager
+    def _figure(self, figsize: Tuple[float, float], pooled: bool = True):
+        """
+        Yield (fig, ax) with fresh axes, taking an idle figure of this size
+        from the pool and returning it cleared afterwards, even if the
+        render fails. Pass pooled=False for data-dependent sizes, which
+        would otherwise grow the pool one key per size.
+        """
+        fig = None
+        if pooled:
+            with _FIG_POOL_LOCK:
+                idle = _FIG_POOL.get(figsize)
+                fig = idle.pop() if idle else None
+        if fig is None:
+            fig = Figure(figsize=figsize)
+        try:
+            yield fig, fig.add_subplot(111)
+        finally:
+            fig.clf()
+            if pooled:
+                with _FIG_POOL_LOCK:
+                    idle = _FIG_POOL.setdefault(figsize, [])
+                    if len(idle) < FIG_POOL_SIZE:
+                        idle.append(fig)
+
+    @staticmethod
+    def _chart_dpi(input_data: Dict) -> int:
+        """Resolution for a chart: explicit "dpi", else the "quality" preset"""
+        if "dpi" in input_data:
+            return input_data["dpi"]
+        return QUALITY_DPI.get(input_data.get("quality"), CHART_DPI)
+
+    def _save_fig(self, fig, chart_path: Path, dpi: int = CHART_DPI):
+        """
+        Render a figure once in the format given by chart_path's suffix,
+        keep the bytes and write them to chart_path
+        """
+        # Layout comes from tight_layout(); bbox_inches='tight' would add a
+        # second draw pass just to measure the bounding box
+        buf = io.BytesIO()
+        fig.savefig(buf, format=chart_path.suffix[1:], dpi=dpi, facecolor='white')
+        data = buf.getvalue()
+
+        # Write atomically: an existing file is treated as a finished chart
+        tmp_path = chart_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, chart_path)
+
+        key = str(chart_path)
+        with self._chart_bytes_lock:
+            self._chart_bytes[key] = data
+            self._chart_bytes.move_to_end(key)
+            if len(self._chart_bytes) > CHART_BYTES_CACHE_SIZE:
+                self._chart_bytes.popitem(last=False)
 
     def _apply_style(self, fig, ax, title: str = "", colors: List[str] = None):
         """Apply consistent styling to charts"""
@@ -91,6 +295,28 @@ class ChartAgent(BaseAgent):
         fig.tight_layout()
         return colors
 
+    async def _render_off_loop(self, name: str, render: Callable, input_data: Dict) -> Dict:
+        """
+        Run a blocking ``_render_*`` method on the agent's executor. Chart
+        files are named by a hash of their inputs, so a request whose chart
+        already exists on disk skips rendering entirely.
+        """
+        fmt = input_data.get("format", "png")
+        if fmt not in CHART_FORMATS:
+            return {"success": False, "error": f"Unsupported chart format: {fmt}"}
+
+        label = self.CHART_LABELS[name]
+        chart_path = self._get_chart_path(name, input_data)
+        if chart_path.exists():
+            self.log(f"Reusing {label.lower()}: {chart_path}")
+            return {"success": True, "path": str(chart_path), "type": name, "cached": True}
+
+        self.log(f"Creating {label.lower()}...")
+        with _chart_rc():
+            result = await self.run_blocking(render, input_data, chart_path)
+        self.log(f"{label} saved: {chart_path}")
+        return result
+
     async def _create_chart(self, input_data: Dict) -> Dict:
         """Create chart based on chart_type"""
         chart_type = input_data.get("chart_type", "bar")
@@ -111,8 +337,10 @@ class ChartAgent(BaseAgent):
         if not HAS_MATPLOTLIB:
             return {"success": False, "error": "matplotlib not available"}
 
-        self.log("Creating bar chart...")
+        return await self._render_off_loop("bar", self._render_bar_chart, input_data)
 
+    def _render_bar_chart(self, input_data: Dict, chart_path: Path) -> Dict:
+        """Create a bar chart (blocking)"""
         data = input_data.get("data", {})
         title = input_data.get("title", "Bar Chart")
         xlabel = input_data.get("xlabel", "")
@@ -120,36 +348,25 @@ class ChartAgent(BaseAgent):
         colors = input_data.get("colors", ['#1F4E79', '#2E75B6', '#5B9BD5'])
         horizontal = input_data.get("horizontal", False)
 
-        labels = list(data.keys())
-        values = list(data.values())
-
-        fig, ax = plt.subplots(figsize=(10, 6))
+        labels, values = _split_items(data)
 
-        if horizontal:
-            bars = ax.barh(labels, values, color=colors[0])
-            ax.set_xlabel(ylabel)
-            ax.set_ylabel(xlabel)
-        else:
-            bars = ax.bar(labels, values, color=colors[0])
-            ax.set_xlabel(xlabel)
-            ax.set_ylabel(ylabel)
-
-        self._apply_style(fig, ax, title, colors)
-
-        # Add value labels
-        for bar, value in zip(bars, values):
+        with self._figure((10, 6)) as (fig, ax):
             if horizontal:
-                ax.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
-                       f'{value}', va='center', fontsize=10)
+                bars = ax.barh(labels, values, color=colors[0])
+                ax.set_xlabel(ylabel)
+                ax.set_ylabel(xlabel)
             else:
-                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                       f'{value}', ha='center', fontsize=10)
+                bars = ax.bar(labels, values, color=colors[0])
+                ax.set_xlabel(xlabel)
+                ax.set_ylabel(ylabel)
 
-        chart_path = self._get_chart_path("bar")
-        fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+            self._apply_style(fig, ax, title, colors)
+
+            # Add value labels
+            ax.bar_label(bars, labels=_value_labels(values), padding=3, fontsize=10)
+
+            self._save_fig(fig, chart_path, self._chart_dpi(input_data))
 
-        self.log(f"Bar chart saved: {chart_path}")
         return {"success": True, "path": str(chart_path), "type": "bar"}
 
     async def _create_line_chart(self, input_data: Dict) -> Dict:
@@ -157,41 +374,37 @@ class ChartAgent(BaseAgent):
         if not HAS_MATPLOTLIB:
             return {"success": False, "error": "matplotlib not available"}
 
-        self.log("Creating line chart...")
+        return await self._render_off_loop("line", self._render_line_chart, input_data)
 
+    def _render_line_chart(self, input_data: Dict, chart_path: Path) -> Dict:
+        """Create a line chart (blocking)"""
         data = input_data.get("data", {})
         title = input_data.get("title", "Line Chart")
         xlabel = input_data.get("xlabel", "")
         ylabel = input_data.get("ylabel", "")
         colors = input_data.get("colors", ['#1F4E79', '#2E75B6', '#5B9BD5', '#9DC3E6'])
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        # Support multiple lines
-        if isinstance(list(data.values())[0], dict):
-            # Multiple series
-            for i, (series_name, series_data) in enumerate(data.items()):
-                x = list(series_data.keys())
-                y = list(series_data.values())
-                color = colors[i % len(colors)]
-                ax.plot(x, y, marker='o', linewidth=2, label=series_name, color=color)
-            ax.legend()
-        else:
-            # Single series
-            x = list(data.keys())
-            y = list(data.values())
-            ax.plot(x, y, marker='o', linewidth=2, color=colors[0])
+        with self._figure((10, 6)) as (fig, ax):
+            # Support multiple lines
+            if isinstance(next(iter(data.values()), None), dict):
+                # Multiple series
+                rgba = to_rgba_array([colors[i % len(colors)] for i in range(len(data))])
+                for i, (series_name, series_data) in enumerate(data.items()):
+                    x, y = _split_items(series_data)
+                    ax.plot(x, y, marker='o', linewidth=2, label=series_name, color=rgba[i])
+                ax.legend()
+            else:
+                # Single series
+                x, y = _split_items(data)
+                ax.plot(x, y, marker='o', linewidth=2, color=colors[0])
 
-        ax.set_xlabel(xlabel)
-        ax.set_ylabel(ylabel)
-        self._apply_style(fig, ax, title, colors)
-        ax.grid(True, linestyle='--', alpha=0.7)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            self._apply_style(fig, ax, title, colors)
+            ax.grid(True, linestyle='--', alpha=0.7)
 
-        chart_path = self._get_chart_path("line")
-        fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+            self._save_fig(fig, chart_path, self._chart_dpi(input_data))
 
-        self.log(f"Line chart saved: {chart_path}")
         return {"success": True, "path": str(chart_path), "type": "line"}
 
     async def _create_pie_chart(self, input_data: Dict) -> Dict:
@@ -199,41 +412,39 @@ class ChartAgent(BaseAgent):
         if not HAS_MATPLOTLIB:
             return {"success": False, "error": "matplotlib not available"}
 
-        self.log("Creating pie chart...")
+        return await self._render_off_loop("pie", self._render_pie_chart, input_data)
 
+    def _render_pie_chart(self, input_data: Dict, chart_path: Path) -> Dict:
+        """Create a pie chart (blocking)"""
         data = input_data.get("data", {})
         title = input_data.get("title", "Pie Chart")
         colors = input_data.get("colors", ['#1F4E79', '#2E75B6', '#5B9BD5', '#9DC3E6', '#BDD7EE'])
         show_percentage = input_data.get("show_percentage", True)
 
-        labels = list(data.keys())
-        values = list(data.values())
+        labels, values = _split_items(data)
 
-        fig, ax = plt.subplots(figsize=(10, 8))
+        with self._figure((10, 8)) as (fig, ax):
+            def autopct_func(pct):
+                return f'{pct:.1f}%' if show_percentage else ''
 
-        def autopct_func(pct):
-            return f'{pct:.1f}%' if show_percentage else ''
+            wedges, texts, autotexts = ax.pie(
+                values,
+                labels=labels,
+                colors=colors[:len(labels)],
+                autopct=autopct_func,
+                startangle=90,
+                explode=[0.02] * len(labels)
+            )
 
-        wedges, texts, autotexts = ax.pie(
-            values,
-            labels=labels,
-            colors=colors[:len(labels)],
-            autopct=autopct_func,
-            startangle=90,
-            explode=[0.02] * len(labels)
-        )
-
-        for autotext in autotexts:
-            autotext.set_fontsize(10)
-            autotext.set_fontweight('bold')
+            for autotext in autotexts:
+                autotext.set_fontsize(10)
+                autotext.set_fontweight('bold')
 
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            fig.tight_layout()
 
-        chart_path = self._get_chart_path("pie")
-        fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+            self._save_fig(fig, chart_path, self._chart_dpi(input_data))
 
-        self.log(f"Pie chart saved: {chart_path}")
         return {"success": True, "path": str(chart_path), "type": "pie"}
 
     async def _create_comparison_chart(self, input_data: Dict) -> Dict:
@@ -241,8 +452,13 @@ class ChartAgent(BaseAgent):
         if not HAS_MATPLOTLIB:
             return {"success": False, "error": "matplotlib not available"}
 
-        self.log("Creating comparison chart...")
+        if not input_data.get("data"):
+            return {"success": False, "error": "No data provided"}
+
+        return await self._render_off_loop("comparison", self._render_comparison_chart, input_data)
 
+    def _render_comparison_chart(self, input_data: Dict, chart_path: Path) -> Dict:
+        """Create a comparison chart (grouped bar chart), blocking"""
         data = input_data.get("data", {})
         title = input_data.get("title", "Comparison")
         xlabel = input_data.get("xlabel", "")
@@ -251,87 +467,87 @@ class ChartAgent(BaseAgent):
 
         # data format: {"Category1": {"A": 10, "B": 20}, "Category2": {"A": 15, "B": 25}}
         categories = list(data.keys())
-        if not categories:
-            return {"success": False, "error": "No data provided"}
 
         groups = list(data[categories[0]].keys())
         n_groups = len(groups)
         n_categories = len(categories)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        with self._figure((12, 6)) as (fig, ax):
+            # Bar positions for every (category, group) pair in one broadcast
+            x = np.arange(n_groups)
+            width = 0.8 / n_categories
+            offsets = (np.arange(n_categories) - n_categories/2 + 0.5) * width
+            positions = x[None, :] + offsets[:, None]
 
-        import numpy as np
-        x = np.arange(n_groups)
-        width = 0.8 / n_categories
+            # One (category x group) matrix; each row is one category's bars
+            values = np.array(
+                [[data[category].get(g, 0) for g in groups] for category in categories],
+                dtype=np.float64,
+            )
 
-        for i, category in enumerate(categories):
-            values = [data[category].get(g, 0) for g in groups]
-            offset = (i - n_categories/2 + 0.5) * width
-            bars = ax.bar(x + offset, values, width, label=category, color=colors[i % len(colors)])
+            # Parse each category's color once, up front
+            rgba = to_rgba_array([colors[i % len(colors)] for i in range(n_categories)])
 
-        ax.set_xlabel(xlabel)
-        ax.set_ylabel(ylabel)
-        ax.set_xticks(x)
-        ax.set_xticklabels(groups)
-        ax.legend()
+            for i, category in enumerate(categories):
+                ax.bar(positions[i], values[i], width, label=category, color=rgba[i])
+
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.set_xticks(x)
+            ax.set_xticklabels(groups)
+            ax.legend()
 
-        self._apply_style(fig, ax, title, colors)
+            self._apply_style(fig, ax, title, colors)
 
-        chart_path = self._get_chart_path("comparison")
-        fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+            self._save_fig(fig, chart_path, self._chart_dpi(input_data))
 
-        self.log(f"Comparison chart saved: {chart_path}")
         return {"success": True, "path": str(chart_path), "type": "comparison"}
 
     async def _create_table_image(self, input_data: Dict) -> Dict:
         """Create a table as an image"""
-        if not HAS_MATPLOTLIB or not HAS_PANDAS:
-            return {"success": False, "error": "matplotlib or pandas not available"}
+        if not HAS_MATPLOTLIB:
+            return {"success": False, "error": "matplotlib not available"}
 
-        self.log("Creating table image...")
+        return await self._render_off_loop("table", self._render_table_image, input_data)
 
+    def _render_table_image(self, input_data: Dict, chart_path: Path) -> Dict:
+        """Create a table as an image (blocking)"""
         data = input_data.get("data", {})
         title = input_data.get("title", "")
         header_color = input_data.get("header_color", "#1F4E79")
         row_colors = input_data.get("row_colors", ["#FFFFFF", "#F2F2F2"])
 
-        df = pd.DataFrame(data)
+        columns, rows = _table_rows(data)
 
-        fig, ax = plt.subplots(figsize=(12, len(df) * 0.5 + 2))
-        ax.axis('off')
+        with self._figure((12, len(rows) * 0.5 + 2), pooled=False) as (fig, ax):
+            ax.axis('off')
 
-        if title:
-            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            if title:
+                ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
 
-        table = ax.table(
-            cellText=df.values,
-            colLabels=df.columns,
-            cellLoc='center',
-            loc='center'
-        )
+            table = ax.table(
+                cellText=rows,
+                colLabels=columns,
+                cellLoc='center',
+                loc='center'
+            )
 
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1.2, 1.5)
+            table.auto_set_font_size(False)
+            table.set_fontsize(10)
+            table.scale(1.2, 1.5)
 
-        # Style header
-        for j, col in enumerate(df.columns):
-            cell = table[(0, j)]
-            cell.set_facecolor(header_color)
-            cell.set_text_props(color='white', fontweight='bold')
+            # Style header and rows in one pass over the cell dict
+            row_color = [row_colors[i % len(row_colors)] for i in range(len(rows))]
+            for (row, _), cell in table.get_celld().items():
+                if row == 0:
+                    cell.set_facecolor(header_color)
+                    cell.set_text_props(color='white', fontweight='bold')
+                else:
+                    cell.set_facecolor(row_color[row - 1])
 
-        # Style rows
-        for i in range(len(df)):
-            for j in range(len(df.columns)):
-                cell = table[(i + 1, j)]
-                cell.set_facecolor(row_colors[i % len(row_colors)])
+            fig.tight_layout()
+            self._save_fig(fig, chart_path, self._chart_dpi(input_data))
 
-        chart_path = self._get_chart_path("table")
-        fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
-
-        self.log(f"Table image saved: {chart_path}")
         return {"success": True, "path": str(chart_path), "type": "table"}
 
     async def _analyze_and_visualize(self, input_data: Dict) -> Dict:
@@ -341,38 +557,36 @@ class ChartAgent(BaseAgent):
 
         self.log("Analyzing data for visualization...")
 
-        charts = []
-
         if not data:
             return {"success": False, "error": "No data provided", "charts": []}
 
-        # Auto-detect best visualization
+        # Auto-detect best visualization; the selected charts render concurrently
+        jobs = []
         if isinstance(data, dict):
-            first_value = list(data.values())[0] if data else None
+            first_value = next(iter(data.values()), None)
 
             if isinstance(first_value, dict):
                 # Nested dict - comparison chart
-                result = await self._create_comparison_chart({
+                jobs.append(self._create_comparison_chart({
                     "data": data,
                     "title": input_data.get("title", "Comparison Analysis")
-                })
-                charts.append(result)
+                }))
 
             elif isinstance(first_value, (int, float)):
                 # Simple dict - bar or pie chart
                 if len(data) <= 6:
-                    result = await self._create_pie_chart({
+                    jobs.append(self._create_pie_chart({
                         "data": data,
                         "title": input_data.get("title", "Distribution")
-                    })
-                    charts.append(result)
+                    }))
 
-                result = await self._create_bar_chart({
+                jobs.append(self._create_bar_chart({
                     "data": data,
                     "title": input_data.get("title", "Values"),
                     "horizontal": len(data) > 5
-                })
-                charts.append(result)
+                }))
+
+        charts = list(await asyncio.gather(*jobs))
 
         self.log(f"Created {len(charts)} visualizations")
         return {
@@ -383,6 +597,9 @@ class ChartAgent(BaseAgent):
 
     def get_chart_for_pptx(self, chart_path: str) -> Optional[bytes]:
         """Get chart image bytes for embedding in PowerPoint"""
+        data = self._chart_bytes.get(str(chart_path))
+        if data is not None:
+            return data
         path = Path(chart_path)
         if path.exists():
             return path.read_bytes()
@@ -15,6 +15,8 @@ class ContentAgent(BaseAgent):
     - Ensure logical flow between slides
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="ContentAgent",
@@ -86,6 +88,10 @@ class ContentAgent(BaseAgent):
 
     async def _write_slide(self, input_data: Dict) -> Dict:
         """Write content for a single slide"""
+        return self._write_slide_sync(input_data)
+
+    def _write_slide_sync(self, input_data: Dict) -> Dict:
+        """Write content for a single slide (no I/O, so no await needed)"""
         slide_type = input_data.get("slide_type", "content")
         title = input_data.get("title", "")
         key_points = input_data.get("key_points", [])
@@ -133,7 +139,7 @@ class ContentAgent(BaseAgent):
 
         # Process each slide from outline
         for slide_def in outline.get("slides", []):
-            slide = await self._write_slide({
+            slide = self._write_slide_sync({
                 "slide_type": slide_def.get("type", "content"),
                 "title": slide_def.get("title", ""),
                 "key_points": slide_def.get("items", []),
@@ -1,9 +1,19 @@
 """Design Agent - Responsible for visual design and layout"""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from copy import deepcopy
+from types import MappingProxyType
 from .base_agent import BaseAgent
 from ..core.task import Task
 
 
+def _freeze(table: Dict) -> MappingProxyType:
+    """Read-only view of a nested dict table"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in table.items()
+    })
+
+
 class DesignAgent(BaseAgent):
     """
     Design Agent: Handles visual design and layout decisions.
@@ -16,8 +26,10 @@ class DesignAgent(BaseAgent):
     - Recommend chart types for data visualization
     """
 
-    # Pre-defined color schemes
-    COLOR_SCHEMES = {
+    __slots__ = ("current_scheme", "_theme_cache", "_slide_design_cache")
+
+    # Pre-defined color schemes (read-only)
+    COLOR_SCHEMES = _freeze({
         "corporate": {
             "primary": "1F4E79",      # Dark blue
             "secondary": "2E75B6",    # Medium blue
@@ -39,10 +51,10 @@ class DesignAgent(BaseAgent):
             "text": "2D3436",         # Charcoal
             "background": "FFFFFF",   # White
         },
-    }
+    })
 
-    # Layout templates
-    LAYOUTS = {
+    # Layout templates (read-only)
+    LAYOUTS = _freeze({
         "title": {
             "title_position": {"x": 0.5, "y": 0.4, "width": 9, "height": 1.5},
             "subtitle_position": {"x": 0.5, "y": 0.6, "width": 9, "height": 0.8},
@@ -61,7 +73,7 @@ class DesignAgent(BaseAgent):
             "left_position": {"x": 0.5, "y": 0.25, "width": 4.2, "height": 4.5},
             "right_position": {"x": 5.0, "y": 0.25, "width": 4.2, "height": 4.5},
         },
-    }
+    })
 
     def __init__(self):
         super().__init__(
@@ -71,6 +83,11 @@ class DesignAgent(BaseAgent):
         )
         self.current_scheme = "corporate"
 
+        # Built themes and slide designs; both depend only on their key.
+        # Callers get deep copies, so edits never reach the cached entry.
+        self._theme_cache: Dict[tuple, Dict] = {}
+        self._slide_design_cache: Dict[Tuple[str, str], Dict] = {}
+
     async def execute_task(self, task: Task) -> Any:
         """Execute design-related tasks"""
         task_type = task.input_data.get("type", "create_theme") if task.input_data else "create_theme"
@@ -93,11 +110,20 @@ class DesignAgent(BaseAgent):
 
         self.log(f"Creating theme: {scheme_name}")
 
-        # Get base scheme
-        colors = self.COLOR_SCHEMES.get(scheme_name, self.COLOR_SCHEMES["corporate"]).copy()
+        key = (scheme_name, frozenset(custom_colors.items()))
+        theme = self._theme_cache.get(key)
+        if theme is None:
+            theme = self._theme_cache[key] = self._build_theme(scheme_name, custom_colors)
+
+        self.current_scheme = scheme_name
+        self.log(f"Theme created with {len(theme['colors'])} colors")
+        return deepcopy(theme)
 
-        # Apply custom colors if provided
-        colors.update(custom_colors)
+    def _build_theme(self, scheme_name: str, custom_colors: Dict) -> Dict:
+        """Build the theme dict for a color scheme plus overrides"""
+        # Base scheme with custom colors applied (a plain dict, so results pickle)
+        base = self.COLOR_SCHEMES.get(scheme_name, self.COLOR_SCHEMES["corporate"])
+        colors = {**base, **custom_colors}
 
         theme = {
             "name": scheme_name,
@@ -115,26 +141,35 @@ class DesignAgent(BaseAgent):
                 "paragraph_spacing": 12,  # points
             },
         }
-
-        self.current_scheme = scheme_name
-        self.log(f"Theme created with {len(colors)} colors")
         return theme
 
     async def _design_slide(self, input_data: Dict) -> Dict:
         """Design layout for a single slide"""
+        return self._design_slide_sync(input_data)
+
+    def _design_slide_sync(self, input_data: Dict) -> Dict:
+        """Design layout for a single slide (no I/O, so no await needed)"""
         slide_type = input_data.get("slide_type", "content")
-        content = input_data.get("content", {})
 
         self.log(f"Designing slide layout: {slide_type}")
 
-        # Get base layout
-        layout = self.LAYOUTS.get(slide_type, self.LAYOUTS["content"]).copy()
+        key = (self.current_scheme, slide_type)
+        design = self._slide_design_cache.get(key)
+        if design is None:
+            design = self._slide_design_cache[key] = self._build_slide_design(slide_type)
+        return deepcopy(design)
+
+    def _build_slide_design(self, slide_type: str) -> Dict:
+        """Build the layout and styling for one slide type in the current scheme"""
+        # Copy the base layout and colors out of the read-only tables
+        layout = self.LAYOUTS.get(slide_type, self.LAYOUTS["content"])
+        colors = self.COLOR_SCHEMES.get(self.current_scheme, self.COLOR_SCHEMES["corporate"])
 
         design = {
             "layout_type": slide_type,
-            "positions": layout,
+            "positions": {name: dict(position) for name, position in layout.items()},
             "style": {
-                "colors": self.COLOR_SCHEMES.get(self.current_scheme, self.COLOR_SCHEMES["corporate"]),
+                "colors": dict(colors),
             },
             "elements": [],
         }
@@ -166,7 +201,7 @@ class DesignAgent(BaseAgent):
         # Design each slide
         slide_designs = []
         for slide in content.get("slides", []):
-            slide_design = await self._design_slide({
+            slide_design = self._design_slide_sync({
                 "slide_type": slide.get("type", "content"),
                 "content": slide,
             })
@@ -0,0 +1,71 @@
+"""Job Runner - Runs presentation pipelines in the background"""
+from typing import Any, Dict, Optional
+from datetime import datetime
+import asyncio
+import itertools
+
+from .ceo_agent import CEOAgent
+
+
+class PresentationJobRunner:
+    """
+    Accepts presentation requests and runs them as background jobs.
+
+    submit() returns a job ID immediately; each job gets its own CEOAgent
+    (a CEOAgent runs one pipeline at a time) and at most ``max_concurrent``
+    pipelines run at once. Job state can be polled with get() or awaited
+    with wait().
+    """
+
+    def __init__(self, max_concurrent: int = 2, **ceo_options: Any):
+        self.max_concurrent = max_concurrent
+        self.ceo_options = ceo_options
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._futures: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._job_seq = itertools.count(1)
+
+    def submit(self, requirements: Dict) -> str:
+        """Queue a create_presentation run and return its job ID"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        job_id = format(next(self._job_seq), "08x")
+        self.jobs[job_id] = {
+            "status": "queued",
+            "submitted_at": datetime.now(),
+            "started_at": None,
+            "completed_at": None,
+            "result": None,
+            "file_path": None,
+        }
+        self._futures[job_id] = asyncio.get_running_loop().create_task(
+            self._run_job(job_id, requirements)
+        )
+        return job_id
+
+    async def _run_job(self, job_id: str, requirements: Dict) -> Dict:
+        """Run one job under the concurrency limit and record its outcome"""
+        job = self.jobs[job_id]
+        async with self._semaphore:
+            job["status"] = "running"
+            job["started_at"] = datetime.now()
+            try:
+                with CEOAgent(**self.ceo_options) as ceo:
+                    result = await ceo.create_presentation(requirements)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+        job["status"] = "completed" if result.get("success") else "failed"
+        job["completed_at"] = datetime.now()
+        job["result"] = result
+        job["file_path"] = result.get("file_path")
+        return result
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the current state of a job"""
+        return self.jobs.get(job_id)
+
+    async def wait(self, job_id: str) -> Dict:
+        """Wait for a job to finish and return its create_presentation result"""
+        return await self._futures[job_id]
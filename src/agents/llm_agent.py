@@ -1,9 +1,17 @@
 """LLM Agent - AI-powered content generation using Claude API"""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
 import os
 import json
+import asyncio
+import contextvars
+import itertools
+import threading
+import weakref
 from .base_agent import BaseAgent
 from ..core.task import Task
+from ..core.pipeline_cache import hash_input
+from ..utils.serialization import dumps, loads
 
 # Try to import anthropic, but make it optional
 try:
@@ -12,6 +20,151 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+# Optional local embeddings for the semantic response cache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
+# Maximum number of Claude responses memoized per LLMAgent
+RESPONSE_CACHE_SIZE = 512
+
+# Maximum number of in-flight Claude requests per LLMAgent
+MAX_CONCURRENT_REQUESTS = 8
+
+# Semantic cache settings (multilingual model: prompts mix Japanese and English)
+SEMANTIC_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+SEMANTIC_THRESHOLD = 0.87
+SEMANTIC_CACHE_SIZE = 2048
+
+# Key set on a task result that was built from offline fallback output
+# because the API call failed; such results must not be cached
+FALLBACK_FLAG = "fallback"
+
+# API fallbacks hit while executing the current task (see execute_task)
+_fallbacks: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "llm_fallbacks", default=None
+)
+
+
+def _note_fallback(reason: str):
+    """Record an API fallback against the task being executed"""
+    events = _fallbacks.get()
+    if events is not None:
+        events.append(reason)
+
+# System prompts, one per task type (the translate prompt is a format template)
+_SYSTEM_GENERATE_CONTENT = """あなたはプレゼンテーション資料の専門家です。
+与えられたトピックに基づいて、構造化されたプレゼンテーションコンテンツを生成してください。
+出力は必ずJSON形式で、以下の構造に従ってください：
+
+{
+    "title": "プレゼンテーションのタイトル",
+    "slides": [
+        {
+            "type": "title|agenda|content|two_column|conclusion",
+            "title": "スライドタイトル",
+            "body": ["箇条書き1", "箇条書き2", ...],
+            "notes": "スピーカーノート"
+        }
+    ]
+}"""
+
+_SYSTEM_GENERATE_SLIDES = """あなたはプレゼンテーション資料の専門家です。
+アウトラインとリサーチデータから、詳細なスライドコンテンツを生成してください。
+各スライドには具体的なデータや洞察を含めてください。
+
+出力は必ずJSON形式で、各スライドに以下を含めてください：
+- title: スライドタイトル
+- type: スライドタイプ
+- body: 本文（配列）
+- key_points: 重要ポイント（配列）
+- data_reference: 参照データ（あれば）
+- notes: スピーカーノート"""
+
+_SYSTEM_IMPROVE_CONTENT = """あなたはプレゼンテーション資料の専門家です。
+既存のコンテンツを改善し、より効果的なプレゼンテーションにしてください。
+元の構造を維持しながら、内容を向上させてください。"""
+
+_SYSTEM_SPEAKER_NOTES = """あなたはプレゼンテーションのコーチです。
+各スライドに対して、効果的なスピーカーノートを生成してください。
+ノートには話すべきポイント、強調点、時間配分のヒントを含めてください。"""
+
+_SYSTEM_SUMMARIZE_DATA = """あなたはデータアナリストです。
+与えられたデータを分析し、プレゼンテーションで使える形式にまとめてください。"""
+
+_SYSTEM_TRANSLATE = """あなたは翻訳の専門家です。
+プレゼンテーションコンテンツを{target_language}に翻訳してください。
+ビジネス文書として適切な表現を使用し、元の構造を維持してください。"""
+
+
+class _SemanticCache:
+    """
+    Nearest-neighbour cache of Claude responses over prompt embeddings.
+
+    Entries are bucketed by system prompt so only requests of the same task
+    type can match, and a user prompt hits when its cosine similarity to a
+    cached one reaches ``threshold``. The model is loaded on first use.
+    """
+
+    def __init__(self, model_name: str = SEMANTIC_MODEL, threshold: float = SEMANTIC_THRESHOLD,
+                 max_size: int = SEMANTIC_CACHE_SIZE):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_size = max_size
+        self._model = None
+        self._buckets: Dict[str, Dict[str, Any]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def encode(self, text: str) -> "np.ndarray":
+        """Unit-normalized embedding of a prompt"""
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, bucket: str, vector: "np.ndarray") -> Optional[str]:
+        """Best cached response for a prompt embedding, if similar enough"""
+        with self._lock:
+            entry = self._buckets.get(bucket)
+            if entry is None:
+                return None
+            scores = entry["vectors"] @ vector
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None
+            entry["last_used"][best] = next(entry["clock"])
+            return entry["responses"][best]
+
+    def store(self, bucket: str, vector: "np.ndarray", response: str):
+        """Add a response, evicting the least recently used one when full"""
+        with self._lock:
+            entry = self._buckets.get(bucket)
+            if entry is None:
+                entry = self._buckets[bucket] = {
+                    "vectors": np.empty((0, vector.shape[0]), dtype=np.float32),
+                    "responses": [],
+                    "last_used": [],
+                    "clock": itertools.count(),
+                }
+            if self._size >= self.max_size:
+                self._evict()
+            entry["vectors"] = np.vstack([entry["vectors"], vector])
+            entry["responses"].append(response)
+            entry["last_used"].append(next(entry["clock"]))
+            self._size += 1
+
+    def _evict(self):
+        """Drop the least recently used entry of the largest bucket"""
+        entry = max(self._buckets.values(), key=lambda e: len(e["responses"]))
+        oldest = min(range(len(entry["last_used"])), key=entry["last_used"].__getitem__)
+        entry["vectors"] = np.delete(entry["vectors"], oldest, axis=0)
+        del entry["responses"][oldest]
+        del entry["last_used"][oldest]
+        self._size -= 1
+
 
 class LLMAgent(BaseAgent):
     """
@@ -25,7 +178,8 @@ class LLMAgent(BaseAgent):
     - Summarize research data into key points
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-20250514"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-20250514",
+                 semantic_cache: bool = False):
         super().__init__(
             name="LLMAgent",
             role="AI Content Generation",
@@ -35,51 +189,145 @@ class LLMAgent(BaseAgent):
         self.model = model
         self.client = None
 
+        # Exact-match LRU of Claude responses keyed by the full request
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+        # AsyncAnthropic's connection pool and the request semaphore bind to
+        # the loop that first uses them, and run_sync gives each task its own
+        # loop: keep one (configured client, client, semaphore) per loop
+        self._per_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._own_client: Optional[Any] = None
+        self._own_client_claimed = False
+
+        # Opt-in similarity tier: paraphrased prompts reuse earlier answers
+        self._semantic_cache: Optional[_SemanticCache] = None
+        if semantic_cache:
+            if HAS_SENTENCE_TRANSFORMERS:
+                self._semantic_cache = _SemanticCache()
+            else:
+                self.log("sentence-transformers not installed, semantic cache disabled", "yellow")
+
         if HAS_ANTHROPIC and self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.client = self._own_client = anthropic.AsyncAnthropic(api_key=self.api_key)
             self.log("Claude API client initialized")
         else:
             self.log("Running in offline mode (no API key or anthropic not installed)", "yellow")
 
+    # Task type -> handler method name; unknown types generate content
+    TASK_HANDLERS = {
+        "generate_content": "_generate_content",
+        "generate_slides": "_generate_slides",
+        "improve_content": "_improve_content",
+        "generate_speaker_notes": "_generate_speaker_notes",
+        "summarize_data": "_summarize_data",
+        "translate": "_translate",
+    }
+
     async def execute_task(self, task: Task) -> Any:
         """Execute LLM-related tasks"""
         task_type = task.input_data.get("type", "generate_content") if task.input_data else "generate_content"
+        handler = getattr(self, self.TASK_HANDLERS.get(task_type, "_generate_content"))
+        events: List[str] = []
+        token = _fallbacks.set(events)
+        try:
+            result = await handler(task.input_data)
+        finally:
+            _fallbacks.reset(token)
+        if events and isinstance(result, dict):
+            result = {**result, FALLBACK_FLAG: True}
+        return result
 
-        if task_type == "generate_content":
-            return await self._generate_content(task.input_data)
-        elif task_type == "generate_slides":
-            return await self._generate_slides(task.input_data)
-        elif task_type == "improve_content":
-            return await self._improve_content(task.input_data)
-        elif task_type == "generate_speaker_notes":
-            return await self._generate_speaker_notes(task.input_data)
-        elif task_type == "summarize_data":
-            return await self._summarize_data(task.input_data)
-        elif task_type == "translate":
-            return await self._translate(task.input_data)
-        else:
-            return await self._generate_content(task.input_data)
-
-    def _call_claude(self, system_prompt: str, user_prompt: str, max_tokens: int = 4096) -> str:
+    def _loop_resources(self) -> Tuple[Any, asyncio.Semaphore]:
+        """Client and request semaphore bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        entry = self._per_loop.get(loop)
+        if entry is None or entry[0] is not self.client:
+            client = self.client
+            if client is self._own_client:
+                # The client built in __init__ serves the first loop only
+                if self._own_client_claimed:
+                    client = anthropic.AsyncAnthropic(api_key=self.api_key)
+                self._own_client_claimed = True
+            entry = (self.client, client, asyncio.Semaphore(MAX_CONCURRENT_REQUESTS))
+            self._per_loop[loop] = entry
+        return entry[1], entry[2]
+
+    async def _call_claude(self, system_prompt: str, user_prompt: str, max_tokens: int = 4096) -> str:
         """Call Claude API with given prompts"""
         if not self.client:
             self.log("API client not available, using fallback", "yellow")
             return self._fallback_response(user_prompt)
 
+        key = hash_input((self.model, system_prompt, user_prompt, max_tokens), digest_size=32)
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached
+
+        vector = None
+        if self._semantic_cache is not None:
+            bucket = hash_input((self.model, system_prompt, max_tokens))
+            vector = await self.run_blocking(self._semantic_cache.encode, user_prompt)
+            similar = self._semantic_cache.lookup(bucket, vector)
+            if similar is not None:
+                with self._response_cache_lock:
+                    self.stats["semantic_hits"] += 1
+                return similar
+
+        with self._response_cache_lock:
+            self.stats["misses"] += 1
+
+        client, semaphore = self._loop_resources()
+
+        parts: List[str] = []
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
-            return message.content[0].text
+            async with semaphore:
+                async with client.messages.stream(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    # Each task type sends a fixed system prompt: mark it as a
+                    # cacheable prefix so repeat calls skip its prefill
+                    system=[{
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }],
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ]
+                ) as stream:
+                    checked = False
+                    async for delta in stream.text_stream:
+                        parts.append(delta)
+                        # Every prompt asks for bare JSON: once the first
+                        # non-blank character shows otherwise, the caller
+                        # will fall back anyway, so stop generating
+                        if not checked and delta.strip():
+                            checked = True
+                            if "".join(parts).lstrip()[0] not in "{[":
+                                self.log("Response is not JSON, stopping stream early", "yellow")
+                                _note_fallback("non-json")
+                                return "".join(parts)
+            text = "".join(parts)
         except Exception as e:
             self.log(f"API call failed: {e}", "red")
+            _note_fallback("api-error")
             return self._fallback_response(user_prompt)
 
+        # Only real responses are cached; failures are retried next time
+        with self._response_cache_lock:
+            self._response_cache[key] = text
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        if vector is not None:
+            self._semantic_cache.store(bucket, vector, text)
+        return text
+
     def _fallback_response(self, prompt: str) -> str:
         """Provide fallback response when API is not available"""
         return json.dumps({
@@ -97,21 +345,7 @@ class LLMAgent(BaseAgent):
 
         self.log(f"Generating content for: {topic}")
 
-        system_prompt = """あなたはプレゼンテーション資料の専門家です。
-与えられたトピックに基づいて、構造化されたプレゼンテーションコンテンツを生成してください。
-出力は必ずJSON形式で、以下の構造に従ってください：
-
-{
-    "title": "プレゼンテーションのタイトル",
-    "slides": [
-        {
-            "type": "title|agenda|content|two_column|conclusion",
-            "title": "スライドタイトル",
-            "body": ["箇条書き1", "箇条書き2", ...],
-            "notes": "スピーカーノート"
-        }
-    ]
-}"""
+        system_prompt = _SYSTEM_GENERATE_CONTENT
 
         user_prompt = f"""以下の条件でプレゼンテーションコンテンツを生成してください：
 
@@ -123,11 +357,11 @@ class LLMAgent(BaseAgent):
 
 JSONのみを出力してください。"""
 
-        response = self._call_claude(system_prompt, user_prompt)
+        response = await self._call_claude(system_prompt, user_prompt)
 
         try:
             # Try to parse JSON from response
-            content = json.loads(response)
+            content = loads(response)
         except json.JSONDecodeError:
             # If not valid JSON, create structured content
             content = self._create_fallback_content(topic, num_slides)
@@ -143,35 +377,25 @@ JSONのみを出力してください。"""
 
         self.log("Generating detailed slides from outline...")
 
-        system_prompt = """あなたはプレゼンテーション資料の専門家です。
-アウトラインとリサーチデータから、詳細なスライドコンテンツを生成してください。
-各スライドには具体的なデータや洞察を含めてください。
-
-出力は必ずJSON形式で、各スライドに以下を含めてください：
-- title: スライドタイトル
-- type: スライドタイプ
-- body: 本文（配列）
-- key_points: 重要ポイント（配列）
-- data_reference: 参照データ（あれば）
-- notes: スピーカーノート"""
+        system_prompt = _SYSTEM_GENERATE_SLIDES
 
         user_prompt = f"""以下のアウトラインを詳細なスライドに展開してください：
 
 アウトライン:
-{json.dumps(outline, ensure_ascii=False, indent=2)}
+{dumps(outline, pretty=True)}
 
 リサーチデータ:
-{json.dumps(research_data, ensure_ascii=False, indent=2) if research_data else "なし"}
+{dumps(research_data, pretty=True) if research_data else "なし"}
 
 インサイト:
-{json.dumps(insights, ensure_ascii=False, indent=2) if insights else "なし"}
+{dumps(insights, pretty=True) if insights else "なし"}
 
 JSONのみを出力してください。"""
 
-        response = self._call_claude(system_prompt, user_prompt)
+        response = await self._call_claude(system_prompt, user_prompt)
 
         try:
-            content = json.loads(response)
+            content = loads(response)
         except json.JSONDecodeError:
             content = outline  # Fallback to outline
 
@@ -184,23 +408,21 @@ JSONのみを出力してください。"""
 
         self.log("Improving content...")
 
-        system_prompt = """あなたはプレゼンテーション資料の専門家です。
-既存のコンテンツを改善し、より効果的なプレゼンテーションにしてください。
-元の構造を維持しながら、内容を向上させてください。"""
+        system_prompt = _SYSTEM_IMPROVE_CONTENT
 
         user_prompt = f"""以下のコンテンツを改善してください：
 
 改善指示: {instructions}
 
 現在のコンテンツ:
-{json.dumps(content, ensure_ascii=False, indent=2)}
+{dumps(content, pretty=True)}
 
 改善されたJSON形式のコンテンツを出力してください。"""
 
-        response = self._call_claude(system_prompt, user_prompt)
+        response = await self._call_claude(system_prompt, user_prompt)
 
         try:
-            improved = json.loads(response)
+            improved = loads(response)
         except json.JSONDecodeError:
             improved = content
 
@@ -212,20 +434,18 @@ JSONのみを出力してください。"""
 
         self.log("Generating speaker notes...")
 
-        system_prompt = """あなたはプレゼンテーションのコーチです。
-各スライドに対して、効果的なスピーカーノートを生成してください。
-ノートには話すべきポイント、強調点、時間配分のヒントを含めてください。"""
+        system_prompt = _SYSTEM_SPEAKER_NOTES
 
         user_prompt = f"""以下のスライドにスピーカーノートを追加してください：
 
-{json.dumps(slides, ensure_ascii=False, indent=2)}
+{dumps(slides, pretty=True)}
 
 各スライドにnotesフィールドを追加したJSONを出力してください。"""
 
-        response = self._call_claude(system_prompt, user_prompt)
+        response = await self._call_claude(system_prompt, user_prompt)
 
         try:
-            result = json.loads(response)
+            result = loads(response)
         except json.JSONDecodeError:
             # Add default notes
             result = {"slides": slides}
@@ -242,15 +462,14 @@ JSONのみを出力してください。"""
 
         self.log("Summarizing data...")
 
-        system_prompt = """あなたはデータアナリストです。
-与えられたデータを分析し、プレゼンテーションで使える形式にまとめてください。"""
+        system_prompt = _SYSTEM_SUMMARIZE_DATA
 
         user_prompt = f"""以下のデータを分析し、重要なポイントをまとめてください：
 
 フォーカス: {focus}
 
 データ:
-{json.dumps(data, ensure_ascii=False, indent=2)}
+{dumps(data, pretty=True)}
 
 以下のJSON形式で出力してください：
 {{
@@ -260,10 +479,10 @@ JSONのみを出力してください。"""
     "data_highlights": [{{}}]
 }}"""
 
-        response = self._call_claude(system_prompt, user_prompt)
+        response = await self._call_claude(system_prompt, user_prompt)
 
         try:
-            result = json.loads(response)
+            result = loads(response)
         except json.JSONDecodeError:
             result = {
                 "summary": "データ分析結果",
@@ -281,20 +500,18 @@ JSONのみを出力してください。"""
 
         self.log(f"Translating to {target_language}...")
 
-        system_prompt = f"""あなたは翻訳の専門家です。
-プレゼンテーションコンテンツを{target_language}に翻訳してください。
-ビジネス文書として適切な表現を使用し、元の構造を維持してください。"""
+        system_prompt = _SYSTEM_TRANSLATE.format(target_language=target_language)
 
         user_prompt = f"""以下のコンテンツを{target_language}に翻訳してください：
 
-{json.dumps(content, ensure_ascii=False, indent=2)}
+{dumps(content, pretty=True)}
 
 翻訳されたJSONを出力してください。"""
 
-        response = self._call_claude(system_prompt, user_prompt)
+        response = await self._call_claude(system_prompt, user_prompt)
 
         try:
-            result = json.loads(response)
+            result = loads(response)
         except json.JSONDecodeError:
             result = content
 
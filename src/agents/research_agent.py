@@ -1,18 +1,62 @@
 """Research Agent - Responsible for data collection and analysis"""
-from typing import Any, Dict, List, Optional
-import pandas as pd
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import numpy as np
+import asyncio
+import functools
+import importlib.util
 from pathlib import Path
 import json
 import os
+import time
 from .base_agent import BaseAgent
 from ..core.task import Task
+from ..core.pipeline_cache import hash_input
+from ..utils.lazy_import import LazyModule
 
-# Try to import web search libraries
+# pandas is imported on first use; it is the bulk of this module's import time
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = LazyModule("pandas", globals(), "pd")
+
+# Web search libraries (only checked for, not imported)
+HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
+# python-calamine backs pandas' Rust-based "calamine" Excel engine (pandas >= 2.2)
 try:
-    import requests
-    HAS_REQUESTS = True
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
 except ImportError:
-    HAS_REQUESTS = False
+    HAS_CALAMINE = False
+
+
+@functools.lru_cache(maxsize=None)
+def _excel_engine() -> Optional[str]:
+    """Engine passed to pd.read_excel; None lets pandas pick openpyxl/xlrd"""
+    if HAS_CALAMINE and tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2):
+        return "calamine"
+    return None
+
+
+# pyarrow enables the on-disk Parquet cache of parsed frames
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Per-column statistics computed for numeric columns, in output order
+STAT_FUNCS = ["mean", "median", "min", "max", "std"]
+
+# Maximum number of parsed DataFrames kept in ResearchAgent.data_cache
+DATA_CACHE_SIZE = 32
+
+# Web search results: at most this many, each reused for SEARCH_CACHE_TTL seconds
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 3600.0
 
 
 class ResearchAgent(BaseAgent):
@@ -28,41 +72,126 @@ class ResearchAgent(BaseAgent):
     - Compare data across multiple sources
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
         super().__init__(
             name="ResearchAgent",
             role="Research & Data Analysis",
             description="Collects data, analyzes information, and extracts insights for presentation content"
         )
-        self.data_cache: Dict[str, pd.DataFrame] = {}
-        self.research_cache: Dict[str, Any] = {}
+        # LRU of parsed DataFrames by "<file>:<sheet>" / "csv:<file>"
+        self.data_cache: OrderedDict[str, pd.DataFrame] = OrderedDict()
+        # LRU of (expiry on time.monotonic(), result) by "search:<query>"
+        self.research_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Parsed frames persisted as Parquet (needs pyarrow), keyed by file version
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    # Task type -> handler method name; unknown types run general research
+    TASK_HANDLERS = {
+        "read_excel": "_read_excel",
+        "read_csv": "_read_csv",
+        "analyze_and_extract": "_analyze_and_extract_task",
+        "analyze_data": "_analyze_data",
+        "extract_insights": "_extract_insights",
+        "compare_data": "_compare_data",
+        "web_search": "_web_search",
+        "aggregate_research": "_aggregate_research",
+        "generate_chart_data": "_generate_chart_data",
+    }
 
     async def execute_task(self, task: Task) -> Any:
         """Execute research-related tasks"""
         task_type = task.input_data.get("type", "analyze") if task.input_data else "analyze"
+        handler = getattr(self, self.TASK_HANDLERS.get(task_type, "_general_research"))
+        return await handler(task.input_data)
+
+    async def _analyze_and_extract_task(self, input_data: Dict) -> Dict:
+        """analyze_and_extract with its arguments taken from task input"""
+        return await self.analyze_and_extract(
+            input_data.get("file_path"),
+            input_data.get("context", ""),
+            input_data.get("sheets"),
+        )
 
-        if task_type == "read_excel":
-            return await self._read_excel(task.input_data)
-        elif task_type == "read_csv":
-            return await self._read_csv(task.input_data)
-        elif task_type == "analyze_data":
-            return await self._analyze_data(task.input_data)
-        elif task_type == "extract_insights":
-            return await self._extract_insights(task.input_data)
-        elif task_type == "compare_data":
-            return await self._compare_data(task.input_data)
-        elif task_type == "web_search":
-            return await self._web_search(task.input_data)
-        elif task_type == "aggregate_research":
-            return await self._aggregate_research(task.input_data)
-        elif task_type == "generate_chart_data":
-            return await self._generate_chart_data(task.input_data)
-        else:
-            return await self._general_research(task.input_data)
+    def _cache_frame(self, key: str, df: pd.DataFrame):
+        """Store a DataFrame, evicting the least recently used beyond DATA_CACHE_SIZE"""
+        self.data_cache[key] = df
+        self.data_cache.move_to_end(key)
+        while len(self.data_cache) > DATA_CACHE_SIZE:
+            self.data_cache.popitem(last=False)
+
+    def _cached_frame(self, key: Any) -> Optional[pd.DataFrame]:
+        """Look up a cached DataFrame and mark it as recently used"""
+        if not isinstance(key, str) or key not in self.data_cache:
+            return None
+        self.data_cache.move_to_end(key)
+        return self.data_cache[key]
+
+    def _parquet_path(self, file_path: str, variant: str) -> Optional[Path]:
+        """Parquet cache file for one parse of a source file, or None when disabled"""
+        if self.cache_dir is None or not HAS_PYARROW:
+            return None
+        stat = os.stat(file_path)
+        key = hash_input(
+            (str(Path(file_path).resolve()), stat.st_mtime_ns, stat.st_size, variant), digest_size=16
+        )
+        return self.cache_dir / f"{key}.parquet"
+
+    def _parse_cached(self, file_path: str, variant: str, parse: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return ``parse()``, reusing a Parquet copy of the same file version
+        when one exists. Frames Parquet cannot hold (non-string column names,
+        mixed-type columns) are simply not cached.
+        """
+        cache_path = self._parquet_path(file_path, variant)
+        if cache_path is not None and cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path, engine="pyarrow")
+            except (OSError, ValueError, TypeError):
+                pass
+
+        df = parse()
+        if cache_path is not None:
+            tmp_path = cache_path.with_suffix(".tmp")
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(tmp_path, engine="pyarrow", compression="snappy")
+                os.replace(tmp_path, cache_path)
+            except (OSError, ValueError, TypeError):
+                tmp_path.unlink(missing_ok=True)
+        return df
 
     async def _read_excel(self, input_data: Dict) -> Dict:
-        """Read and parse Excel file"""
-        file_path = input_data.get("file_path")
+        """Read and parse Excel file (only the listed "sheets" when given)"""
+        result, _ = await self._load_excel(input_data.get("file_path"), input_data.get("sheets"))
+        return result
+
+    def _parse_workbook(
+        self, file_path: str, sheets: Optional[List[str]]
+    ) -> Tuple[List[str], Optional[Dict[str, pd.DataFrame]]]:
+        """
+        List a workbook's sheets and parse the wanted ones serially, blocking.
+        Returns no frames when the sheets should be parsed in parallel instead:
+        calamine releases the GIL while reading a sheet, so several sheets can
+        overlap, each worker with its own reader.
+        """
+        engine = _excel_engine()
+        with pd.ExcelFile(file_path, engine=engine) as book:
+            sheet_names = list(book.sheet_names)
+            wanted = sheets or sheet_names
+            if engine == "calamine" and len(wanted) > 1:
+                return sheet_names, None
+            return sheet_names, {
+                name: self._parse_cached(file_path, f"sheet:{name}", functools.partial(book.parse, name))
+                for name in wanted
+            }
+
+    async def _load_excel(
+        self, file_path: Optional[str], sheets: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict[str, pd.DataFrame]]:
+        """
+        Parse an Excel file; returns the summary and the DataFrames by sheet.
+        With ``sheets`` only those are parsed, the rest are just listed.
+        """
         if not file_path:
             raise ValueError("file_path is required")
 
@@ -72,34 +201,99 @@ class ResearchAgent(BaseAgent):
 
         self.log(f"Reading Excel file: {file_path}")
 
-        # Read all sheets
-        excel_data = pd.read_excel(file_path, sheet_name=None)
+        sheet_names, excel_data = await self.run_blocking(self._parse_workbook, file_path, sheets)
+        if excel_data is None:
+            wanted = sheets or sheet_names
+            frames = await asyncio.gather(*(
+                self.run_blocking(
+                    self._parse_cached,
+                    file_path,
+                    f"sheet:{name}",
+                    functools.partial(pd.read_excel, file_path, sheet_name=name, engine=_excel_engine()),
+                )
+                for name in wanted
+            ))
+            excel_data = dict(zip(wanted, frames))
 
         result = {
             "file_path": str(file_path),
             "sheets": {},
             "summary": {
-                "total_sheets": len(excel_data),
-                "sheet_names": list(excel_data.keys()),
+                "total_sheets": len(sheet_names),
+                "sheet_names": sheet_names,
             }
         }
 
         for sheet_name, df in excel_data.items():
-            self.data_cache[f"{file_path}:{sheet_name}"] = df
+            self._cache_frame(f"{file_path}:{sheet_name}", df)
             result["sheets"][sheet_name] = {
                 "rows": len(df),
                 "columns": list(df.columns),
-                "sample": df.head(5).to_dict() if len(df) > 0 else {},
+                "sample": df.head(5).to_dict(orient="list") if len(df) > 0 else {},
             }
 
-        self.log(f"Loaded {len(excel_data)} sheets from Excel file")
-        return result
+        self.log(f"Loaded {len(excel_data)} of {len(sheet_names)} sheets from Excel file")
+        return result, excel_data
+
+    async def analyze_and_extract(
+        self, file_path: str, context: str = "", sheets: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Read a data file, analyze every sheet (or just ``sheets``) and
+        extract insights in one pass (read_excel/read_csv -> analyze_data ->
+        extract_insights), using the parsed DataFrame directly instead of a
+        serialized sample.
+        """
+        if not file_path:
+            raise ValueError("file_path is required")
+
+        # Frames are taken from the parse itself: a large workbook may
+        # already have evicted its first sheets from data_cache
+        frames: Dict[str, pd.DataFrame] = {}
+        if file_path.endswith(('.xlsx', '.xls')):
+            research, frames = await self._load_excel(file_path, sheets)
+        else:
+            research = await self._read_csv({"file_path": file_path})
+
+        analysis = None
+        insights = None
+        sheets = research.get("sheets") or {}
+        if sheets:
+            # Sheets are independent, so analyze their samples concurrently
+            self.log(f"Analyzing {len(sheets)} sheet(s)...")
+            sheet_analyses = await asyncio.gather(*(
+                self.run_blocking(self._analyze_frame, frames[name].head(5))
+                for name in sheets
+            ))
+            analysis = self._merge_analyses(dict(zip(sheets, sheet_analyses)))
+            insights = await self._extract_insights({"analysis": analysis, "context": context})
+
+        return {"research": research, "analysis": analysis, "insights": insights}
+
+    @staticmethod
+    def _merge_analyses(sheet_analyses: Dict[str, Dict]) -> Dict:
+        """
+        Combine per-sheet analyses into one. Column statistics are keyed by
+        "<sheet>: <column>" when there is more than one sheet.
+        """
+        if len(sheet_analyses) == 1:
+            analysis = dict(next(iter(sheet_analyses.values())))
+        else:
+            analysis = {
+                "statistics": {
+                    f"{sheet}: {col}": col_stats
+                    for sheet, sheet_analysis in sheet_analyses.items()
+                    for col, col_stats in sheet_analysis["statistics"].items()
+                },
+            }
+        analysis["sheets"] = sheet_analyses
+        return analysis
 
     async def _analyze_data(self, input_data: Dict) -> Dict:
         """Analyze data and extract statistics"""
         data = input_data.get("data")
         if data is None and "cache_key" in input_data:
-            data = self.data_cache.get(input_data["cache_key"])
+            data = self._cached_frame(input_data["cache_key"])
 
         if data is None:
             raise ValueError("No data provided for analysis")
@@ -112,27 +306,34 @@ class ResearchAgent(BaseAgent):
             raise ValueError("Data must be a dict or DataFrame")
 
         self.log("Analyzing data...")
+        analysis = self._analyze_frame(df)
+        self.log("Data analysis complete")
+        return analysis
 
+    def _analyze_frame(self, df: pd.DataFrame) -> Dict:
+        """Compute shape, dtype, missing-value and numeric statistics for a DataFrame"""
         analysis = {
             "shape": {"rows": len(df), "columns": len(df.columns)},
             "columns": list(df.columns),
             "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
             "statistics": {},
-            "missing_values": df.isnull().sum().to_dict(),
         }
 
-        # Numeric column statistics
+        # Numeric columns: statistics and non-null counts in one agg call;
+        # only the remaining columns need a separate isna() scan
         numeric_cols = df.select_dtypes(include=["number"]).columns
-        for col in numeric_cols:
-            analysis["statistics"][col] = {
-                "mean": float(df[col].mean()) if not pd.isna(df[col].mean()) else None,
-                "median": float(df[col].median()) if not pd.isna(df[col].median()) else None,
-                "min": float(df[col].min()) if not pd.isna(df[col].min()) else None,
-                "max": float(df[col].max()) if not pd.isna(df[col].max()) else None,
-                "std": float(df[col].std()) if not pd.isna(df[col].std()) else None,
-            }
-
-        self.log("Data analysis complete")
+        missing = df.drop(columns=numeric_cols).isna().sum().to_dict()
+        if len(numeric_cols):
+            stats = df[numeric_cols].agg(["count", *STAT_FUNCS]).to_dict()
+            for col in numeric_cols:
+                col_stats = stats[col]
+                missing[col] = len(df) - int(col_stats.pop("count"))
+                analysis["statistics"][col] = {
+                    stat: None if pd.isna(value) else float(value)
+                    for stat, value in col_stats.items()
+                }
+
+        analysis["missing_values"] = {col: missing[col] for col in df.columns}
         return analysis
 
     async def _extract_insights(self, input_data: Dict) -> List[Dict]:
@@ -144,25 +345,38 @@ class ResearchAgent(BaseAgent):
 
         insights = []
 
-        # Generate insights based on statistics
+        # Generate insights based on statistics, one column per row of a
+        # (min, max, mean) matrix; missing (None -> NaN) and zero values
+        # produce no insight
         stats = analysis.get("statistics", {})
-        for col, col_stats in stats.items():
-            if col_stats.get("max") and col_stats.get("min"):
-                range_val = col_stats["max"] - col_stats["min"]
-                insights.append({
-                    "type": "range",
-                    "column": col,
-                    "description": f"{col}の範囲: {col_stats['min']:.2f} ~ {col_stats['max']:.2f}",
-                    "value": range_val,
-                })
-
-            if col_stats.get("mean"):
-                insights.append({
-                    "type": "average",
-                    "column": col,
-                    "description": f"{col}の平均値: {col_stats['mean']:.2f}",
-                    "value": col_stats["mean"],
-                })
+        if stats:
+            values = np.array(
+                [[col_stats.get(k) for k in ("min", "max", "mean")] for col_stats in stats.values()],
+                dtype=np.float64,
+            )
+            present = ~np.isnan(values) & (values != 0)
+            has_range = present[:, 0] & present[:, 1]
+            mins, maxs, means = values.T.tolist()
+            ranges = (values[:, 1] - values[:, 0]).tolist()
+
+            for col, lo, hi, span, mean, with_range, with_mean in zip(
+                stats, mins, maxs, ranges, means, has_range.tolist(), present[:, 2].tolist()
+            ):
+                if with_range:
+                    insights.append({
+                        "type": "range",
+                        "column": col,
+                        "description": f"{col}の範囲: {lo:.2f} ~ {hi:.2f}",
+                        "value": span,
+                    })
+
+                if with_mean:
+                    insights.append({
+                        "type": "average",
+                        "column": col,
+                        "description": f"{col}の平均値: {mean:.2f}",
+                        "value": mean,
+                    })
 
         self.log(f"Extracted {len(insights)} insights")
         return insights
@@ -195,20 +409,23 @@ class ResearchAgent(BaseAgent):
 
         self.log(f"Reading CSV file: {file_path}")
 
-        try:
-            df = pd.read_csv(file_path, encoding=encoding)
-        except UnicodeDecodeError:
-            df = pd.read_csv(file_path, encoding="shift-jis")
+        def parse() -> pd.DataFrame:
+            try:
+                return pd.read_csv(file_path, encoding=encoding)
+            except UnicodeDecodeError:
+                return pd.read_csv(file_path, encoding="shift-jis")
+
+        df = await self.run_blocking(self._parse_cached, file_path, f"csv:{encoding}", parse)
 
         cache_key = f"csv:{file_path}"
-        self.data_cache[cache_key] = df
+        self._cache_frame(cache_key, df)
 
         result = {
             "file_path": str(file_path),
             "cache_key": cache_key,
             "rows": len(df),
             "columns": list(df.columns),
-            "sample": df.head(5).to_dict() if len(df) > 0 else {},
+            "sample": df.head(5).to_dict(orient="list") if len(df) > 0 else {},
         }
 
         self.log(f"Loaded CSV with {len(df)} rows")
@@ -230,22 +447,35 @@ class ResearchAgent(BaseAgent):
         # Load datasets from cache or input
         dfs = []
         for ds in datasets:
-            if isinstance(ds, str) and ds in self.data_cache:
-                dfs.append({"name": ds, "df": self.data_cache[ds]})
+            cached = self._cached_frame(ds)
+            if cached is not None:
+                dfs.append({"name": ds, "df": cached})
             elif isinstance(ds, dict):
                 dfs.append({"name": ds.get("name", "dataset"), "df": pd.DataFrame(ds.get("data", {}))})
 
         if len(dfs) < 2:
             return {"error": "Need at least 2 datasets for comparison", "datasets": len(dfs)}
 
-        # Compare numeric columns
-        for col in compare_columns or []:
+        # Mean and sum of every compared numeric column, one agg call per dataset
+        compare_columns = compare_columns or []
+        aggregates = []
+        for ds in dfs:
+            df = ds["df"]
+            numeric = [
+                col for col in dict.fromkeys(compare_columns)
+                if col in df.columns and pd.api.types.is_numeric_dtype(df[col])
+            ]
+            aggregates.append(df[numeric].agg(["mean", "sum"]).to_dict() if numeric else {})
+
+        # Compare numeric columns (non-numeric ones report None)
+        for col in compare_columns:
             col_comparison = {"column": col, "values": {}}
-            for ds in dfs:
+            for ds, agg in zip(dfs, aggregates):
                 if col in ds["df"].columns:
+                    col_stats = agg.get(col)
                     col_comparison["values"][ds["name"]] = {
-                        "mean": float(ds["df"][col].mean()) if pd.api.types.is_numeric_dtype(ds["df"][col]) else None,
-                        "sum": float(ds["df"][col].sum()) if pd.api.types.is_numeric_dtype(ds["df"][col]) else None,
+                        "mean": float(col_stats["mean"]) if col_stats else None,
+                        "sum": float(col_stats["sum"]) if col_stats else None,
                     }
             comparison["comparisons"].append(col_comparison)
 
@@ -268,11 +498,13 @@ class ResearchAgent(BaseAgent):
                 "note": "Web search not available (requests library not installed)"
             }
 
-        # Cache check
+        # Cache check (expired entries are replaced below)
         cache_key = f"search:{query}"
-        if cache_key in self.research_cache:
+        cached = self.research_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.research_cache.move_to_end(cache_key)
             self.log("Returning cached search results")
-            return self.research_cache[cache_key]
+            return cached[1]
 
         # Placeholder response - in production, integrate real search API
         result = {
@@ -281,7 +513,10 @@ class ResearchAgent(BaseAgent):
             "note": "Search API integration required for live results"
         }
 
-        self.research_cache[cache_key] = result
+        self.research_cache[cache_key] = (time.monotonic() + SEARCH_CACHE_TTL, result)
+        self.research_cache.move_to_end(cache_key)
+        while len(self.research_cache) > SEARCH_CACHE_SIZE:
+            self.research_cache.popitem(last=False)
         return result
 
     async def _aggregate_research(self, input_data: Dict) -> Dict:
@@ -328,10 +563,8 @@ class ResearchAgent(BaseAgent):
         self.log(f"Generating chart data: {chart_type}")
 
         # Get dataframe from cache or input
-        df = None
-        if isinstance(source, str) and source in self.data_cache:
-            df = self.data_cache[source]
-        elif isinstance(source, dict):
+        df = self._cached_frame(source)
+        if df is None and isinstance(source, dict):
             df = pd.DataFrame(source)
 
         if df is None:
@@ -343,27 +576,31 @@ class ResearchAgent(BaseAgent):
             "labels": [],
         }
 
+        # Series.tolist boxes every value in one C loop (plain Python scalars,
+        # Timestamps for datetimes) instead of per-element Series iteration
         if chart_type == "bar" and x_column and y_column:
             if group_by:
                 grouped = df.groupby([x_column, group_by])[y_column].sum().unstack()
                 chart_data["data"] = grouped.to_dict()
             else:
-                chart_data["data"] = dict(zip(df[x_column], df[y_column]))
-                chart_data["labels"] = list(df[x_column])
+                xs = df[x_column].tolist()
+                chart_data["data"] = dict(zip(xs, df[y_column].tolist()))
+                chart_data["labels"] = xs
 
         elif chart_type == "pie" and x_column and y_column:
-            chart_data["data"] = dict(zip(df[x_column], df[y_column]))
+            chart_data["data"] = dict(zip(df[x_column].tolist(), df[y_column].tolist()))
 
         elif chart_type == "line" and x_column and y_column:
-            chart_data["data"] = dict(zip(df[x_column], df[y_column]))
-            chart_data["labels"] = list(df[x_column])
+            xs = df[x_column].tolist()
+            chart_data["data"] = dict(zip(xs, df[y_column].tolist()))
+            chart_data["labels"] = xs
 
         self.log("Chart data generated")
         return chart_data
 
     def get_cached_data(self, key: str) -> Optional[pd.DataFrame]:
         """Get cached dataframe by key"""
-        return self.data_cache.get(key)
+        return self._cached_frame(key)
 
     def list_cached_data(self) -> List[str]:
         """List all cached data keys"""
@@ -1,7 +1,8 @@
 """Core modules for orchestration"""
 from .message import Message, MessageType
-from .task import Task, TaskStatus
-from .workflow import Workflow
+from .task import Task, TaskStatus, TaskSummary
+from .workflow import Node, Workflow, WorkflowEngine
+from .pipeline_cache import PipelineCache
 from .templates import PresentationTemplate, SlideType, ThemeColors, ThemeFonts
 
 __all__ = [
@@ -9,7 +10,11 @@ __all__ = [
     "MessageType",
     "Task",
     "TaskStatus",
+    "TaskSummary",
     "Workflow",
+    "WorkflowEngine",
+    "Node",
+    "PipelineCache",
     "PresentationTemplate",
     "SlideType",
     "ThemeColors",
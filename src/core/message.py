@@ -1,9 +1,11 @@
 """Message types for inter-agent communication"""
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
+from ..utils.serialization import dumps_bytes
+
 
 class MessageType(str, Enum):
     """Types of messages exchanged between agents"""
@@ -16,19 +18,16 @@ class MessageType(str, Enum):
 
 
 class Message(BaseModel):
-    """Message object for agent communication"""
+    """Message object for agent communication (immutable once sent)"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     sender: str
     receiver: str
     type: MessageType
     content: Any
     metadata: Optional[dict] = None
-    timestamp: datetime = None
-
-    def __init__(self, **data):
-        if data.get("timestamp") is None:
-            data["timestamp"] = datetime.now()
-        super().__init__(**data)
+    timestamp: datetime = Field(default_factory=datetime.now)
 
     def to_dict(self) -> dict:
         return {
@@ -40,3 +39,7 @@ class Message(BaseModel):
             "metadata": self.metadata,
             "timestamp": self.timestamp.isoformat(),
         }
+
+    def to_json(self) -> bytes:
+        """to_dict() as UTF-8 JSON (orjson when installed)"""
+        return dumps_bytes(self.to_dict())
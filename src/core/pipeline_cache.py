@@ -0,0 +1,92 @@
+"""Persistent memoization for presentation pipeline results"""
+from typing import Any, Dict, Optional
+from pathlib import Path
+import hashlib
+import os
+import pickle
+import tempfile
+
+from ..utils.serialization import dumps_bytes
+
+
+_MISSING = object()
+
+
+def hash_input(data: Any, digest_size: int = 8) -> str:
+    """Stable blake2b hex digest of JSON-serializable data"""
+    payload = dumps_bytes(data, sort_keys=True)
+    return hashlib.blake2b(payload, digest_size=digest_size).hexdigest()
+
+
+class PipelineCache:
+    """
+    Content-addressed cache for CEOAgent pipeline results.
+
+    Values are kept in memory and, when a cache directory is configured,
+    pickled to ``<cache_dir>/<key>.pkl`` so they survive across runs.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory: Dict[str, Any] = {}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable key from JSON-serializable parts"""
+        return hash_input(parts, digest_size=32)
+
+    @staticmethod
+    def file_digest(path: str) -> str:
+        """SHA-256 of a file's contents"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value, falling back to disk on a memory miss"""
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self.cache_dir is None:
+            return default
+
+        try:
+            with open(self._path(key), "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+
+        self._memory[key] = value
+        return value
+
+    def set(self, key: str, value: Any):
+        """Store a value in memory and (if configured) on disk"""
+        self._memory[key] = value
+        if self.cache_dir is None:
+            return
+
+        # Each writer gets its own temp file, so concurrent jobs storing the
+        # same key don't clobber each other. A failed disk write only loses
+        # the on-disk copy; the value stays cached in memory.
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def clear(self):
+        """Drop all cached values"""
+        self._memory.clear()
+        if self.cache_dir is not None and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.pkl"):
+                path.unlink(missing_ok=True)
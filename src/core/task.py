@@ -1,7 +1,8 @@
 """Task management for agent workflows"""
 from enum import Enum
-from typing import Any, Optional, List
-from pydantic import BaseModel
+from typing import Any, Collection, Optional, List
+from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass
 from datetime import datetime
 
 
@@ -17,25 +18,23 @@ class TaskStatus(str, Enum):
 
 class Task(BaseModel):
     """Task object representing work to be done by an agent"""
+    # Tasks change status as they run, so only unknown fields are rejected
+    model_config = ConfigDict(extra="forbid")
+
     id: str
     name: str
     description: str
     assigned_to: Optional[str] = None
     status: TaskStatus = TaskStatus.PENDING
     priority: int = 1  # 1 = highest priority
-    dependencies: List[str] = []  # List of task IDs that must complete first
+    dependencies: List[str] = Field(default_factory=list)  # List of task IDs that must complete first
     input_data: Optional[Any] = None
     output_data: Optional[Any] = None
     error_message: Optional[str] = None
-    created_at: datetime = None
+    created_at: datetime = Field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
-    def __init__(self, **data):
-        if data.get("created_at") is None:
-            data["created_at"] = datetime.now()
-        super().__init__(**data)
-
     def start(self):
         """Mark task as started"""
         self.status = TaskStatus.IN_PROGRESS
@@ -54,6 +53,27 @@ class Task(BaseModel):
         self.error_message = error_message
         self.completed_at = datetime.now()
 
-    def is_ready(self, completed_tasks: List[str]) -> bool:
-        """Check if all dependencies are satisfied"""
+    def is_ready(self, completed_tasks: Collection[str]) -> bool:
+        """Check if all dependencies are satisfied (pass a set for O(1) lookups)"""
         return all(dep in completed_tasks for dep in self.dependencies)
+
+
+@dataclass(slots=True)
+class TaskSummary:
+    """Payload-free record of a finished task, kept for agent bookkeeping"""
+    id: str
+    name: str
+    duration_s: float
+    success: bool
+
+    @classmethod
+    def from_task(cls, task: Task) -> "TaskSummary":
+        duration = 0.0
+        if task.started_at and task.completed_at:
+            duration = (task.completed_at - task.started_at).total_seconds()
+        return cls(
+            id=task.id,
+            name=task.name,
+            duration_s=duration,
+            success=task.status == TaskStatus.COMPLETED,
+        )
@@ -1,10 +1,11 @@
 """Template management for PowerPoint presentations"""
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from pathlib import Path
-import json
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from ..utils.serialization import dumps_bytes, loads
+
 
 class SlideType(Enum):
     """Types of slides available in templates"""
@@ -23,7 +24,7 @@ class SlideType(Enum):
     THANK_YOU = "thank_you"
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeColors:
     """Color scheme for a theme"""
     primary: str = "#1F4E79"
@@ -35,7 +36,7 @@ class ThemeColors:
     background_alt: str = "#F5F5F5"
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeFonts:
     """Font settings for a theme"""
     title_name: str = "Yu Gothic UI"
@@ -48,7 +49,7 @@ class ThemeFonts:
     caption_size: int = 12
 
 
-@dataclass
+@dataclass(slots=True)
 class SlideTemplate:
     """Template for a single slide"""
     type: SlideType
@@ -57,6 +58,82 @@ class SlideTemplate:
     default_content: Dict[str, Any]
 
 
+# Placeholder content per slide type, for generate_slide_content_template
+_SLIDE_CONTENT_TEMPLATES: Dict[str, Dict] = {
+    "title": {
+        "type": "title",
+        "title": "[タイトルを入力]",
+        "subtitle": "[サブタイトルを入力]",
+        "author": "",
+        "date": ""
+    },
+    "agenda": {
+        "type": "agenda",
+        "title": "アジェンダ",
+        "items": ["項目1", "項目2", "項目3"]
+    },
+    "content": {
+        "type": "content",
+        "title": "[スライドタイトル]",
+        "body": ["ポイント1", "ポイント2", "ポイント3"]
+    },
+    "two_column": {
+        "type": "two_column",
+        "title": "[スライドタイトル]",
+        "left_title": "左側",
+        "left": ["項目1", "項目2"],
+        "right_title": "右側",
+        "right": ["項目1", "項目2"]
+    },
+    "comparison": {
+        "type": "comparison",
+        "title": "比較",
+        "items": [
+            {"name": "オプションA", "features": ["特徴1", "特徴2"]},
+            {"name": "オプションB", "features": ["特徴1", "特徴2"]}
+        ]
+    },
+    "chart": {
+        "type": "chart",
+        "title": "[チャートタイトル]",
+        "chart_type": "bar",
+        "data": {}
+    },
+    "timeline": {
+        "type": "timeline",
+        "title": "タイムライン",
+        "events": [
+            {"date": "Phase 1", "description": "説明"},
+            {"date": "Phase 2", "description": "説明"}
+        ]
+    },
+    "conclusion": {
+        "type": "conclusion",
+        "title": "まとめ",
+        "body": ["要点1", "要点2", "次のステップ"]
+    },
+    "qa": {
+        "type": "qa",
+        "title": "Q&A",
+        "subtitle": "ご質問はありますか？"
+    },
+    "thank_you": {
+        "type": "thank_you",
+        "title": "ありがとうございました",
+        "contact": "お問い合わせ先"
+    }
+}
+
+
+def _copy_template(value: Any) -> Any:
+    """Copy the dicts and lists of a template so callers can fill it in"""
+    if isinstance(value, dict):
+        return {key: _copy_template(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_template(item) for item in value]
+    return value
+
+
 class PresentationTemplate:
     """
     Manages presentation templates with predefined themes and layouts.
@@ -289,70 +366,95 @@ class PresentationTemplate:
         }
     }
 
+    # list_themes/list_presentation_types entries for the static tables above
+    _BUILTIN_THEME_LIST: List[Dict] = [
+        {
+            "id": name,
+            "name": theme["name"],
+            "description": theme["description"]
+        }
+        for name, theme in THEMES.items()
+    ]
+    _BUILTIN_TYPE_LIST: List[Dict] = [
+        {
+            "id": name,
+            "name": ptype["name"],
+            "description": ptype["description"],
+            "slide_count": len(ptype["slide_structure"])
+        }
+        for name, ptype in PRESENTATION_TYPES.items()
+    ]
+
     def __init__(self, template_dir: Optional[str] = None):
         self.template_dir = Path(template_dir) if template_dir else None
         self.custom_themes: Dict[str, Dict] = {}
         self.custom_templates: Dict[str, Dict] = {}
+        # Directories save_theme has already created
+        self._created_dirs: Set[Path] = set()
 
     def get_theme(self, theme_name: str) -> Dict:
         """Get theme by name"""
         if theme_name in self.custom_themes:
             return self.custom_themes[theme_name]
         if theme_name in self.THEMES:
-            theme = self.THEMES[theme_name]
-            return {
-                "name": theme["name"],
-                "description": theme["description"],
-                "colors": asdict(theme["colors"]),
-                "fonts": {
-                    "title": {
-                        "name": theme["fonts"].title_name,
-                        "size": theme["fonts"].title_size,
-                        "bold": theme["fonts"].title_bold
-                    },
-                    "body": {
-                        "name": theme["fonts"].body_name,
-                        "size": theme["fonts"].body_size,
-                        "bold": theme["fonts"].body_bold
-                    },
-                    "caption": {
-                        "name": theme["fonts"].caption_name,
-                        "size": theme["fonts"].caption_size
-                    }
-                }
-            }
+            return self._build_theme(theme_name)
         # Default to corporate
         return self.get_theme("corporate")
 
+    @classmethod
+    def _build_theme(cls, theme_name: str) -> Dict:
+        """Build the dict form of a built-in theme"""
+        theme = cls.THEMES[theme_name]
+        return {
+            "name": theme["name"],
+            "description": theme["description"],
+            "colors": asdict(theme["colors"]),
+            "fonts": {
+                "title": {
+                    "name": theme["fonts"].title_name,
+                    "size": theme["fonts"].title_size,
+                    "bold": theme["fonts"].title_bold
+                },
+                "body": {
+                    "name": theme["fonts"].body_name,
+                    "size": theme["fonts"].body_size,
+                    "bold": theme["fonts"].body_bold
+                },
+                "caption": {
+                    "name": theme["fonts"].caption_name,
+                    "size": theme["fonts"].caption_size
+                }
+            }
+        }
+
     def get_presentation_type(self, type_name: str) -> Dict:
         """Get presentation type template"""
         if type_name in self.custom_templates:
             return self.custom_templates[type_name]
         if type_name in self.PRESENTATION_TYPES:
-            ptype = self.PRESENTATION_TYPES[type_name]
-            return {
-                "name": ptype["name"],
-                "description": ptype["description"],
-                "recommended_theme": ptype["recommended_theme"],
-                "slide_structure": [
-                    {
-                        "type": s["type"].value,
-                        "purpose": s["purpose"]
-                    }
-                    for s in ptype["slide_structure"]
-                ]
-            }
+            return self._build_presentation_type(type_name)
         return None
 
+    @classmethod
+    def _build_presentation_type(cls, type_name: str) -> Dict:
+        """Build the dict form of a built-in presentation type"""
+        ptype = cls.PRESENTATION_TYPES[type_name]
+        return {
+            "name": ptype["name"],
+            "description": ptype["description"],
+            "recommended_theme": ptype["recommended_theme"],
+            "slide_structure": [
+                {
+                    "type": s["type"].value,
+                    "purpose": s["purpose"]
+                }
+                for s in ptype["slide_structure"]
+            ]
+        }
+
     def list_themes(self) -> List[Dict]:
-        """List all available themes"""
-        themes = []
-        for name, theme in self.THEMES.items():
-            themes.append({
-                "id": name,
-                "name": theme["name"],
-                "description": theme["description"]
-            })
+        """List all available themes (built-in entries are shared, don't mutate them)"""
+        themes = list(self._BUILTIN_THEME_LIST)
         for name, theme in self.custom_themes.items():
             themes.append({
                 "id": name,
@@ -363,16 +465,8 @@ class PresentationTemplate:
         return themes
 
     def list_presentation_types(self) -> List[Dict]:
-        """List all available presentation types"""
-        types = []
-        for name, ptype in self.PRESENTATION_TYPES.items():
-            types.append({
-                "id": name,
-                "name": ptype["name"],
-                "description": ptype["description"],
-                "slide_count": len(ptype["slide_structure"])
-            })
-        return types
+        """List all available presentation types (entries are shared, don't mutate them)"""
+        return list(self._BUILTIN_TYPE_LIST)
 
     def register_custom_theme(self, name: str, theme: Dict):
         """Register a custom theme"""
@@ -384,81 +478,20 @@ class PresentationTemplate:
 
     def generate_slide_content_template(self, slide_type: str) -> Dict:
         """Generate a template for slide content based on type"""
-        templates = {
-            "title": {
-                "type": "title",
-                "title": "[タイトルを入力]",
-                "subtitle": "[サブタイトルを入力]",
-                "author": "",
-                "date": ""
-            },
-            "agenda": {
-                "type": "agenda",
-                "title": "アジェンダ",
-                "items": ["項目1", "項目2", "項目3"]
-            },
-            "content": {
-                "type": "content",
-                "title": "[スライドタイトル]",
-                "body": ["ポイント1", "ポイント2", "ポイント3"]
-            },
-            "two_column": {
-                "type": "two_column",
-                "title": "[スライドタイトル]",
-                "left_title": "左側",
-                "left": ["項目1", "項目2"],
-                "right_title": "右側",
-                "right": ["項目1", "項目2"]
-            },
-            "comparison": {
-                "type": "comparison",
-                "title": "比較",
-                "items": [
-                    {"name": "オプションA", "features": ["特徴1", "特徴2"]},
-                    {"name": "オプションB", "features": ["特徴1", "特徴2"]}
-                ]
-            },
-            "chart": {
-                "type": "chart",
-                "title": "[チャートタイトル]",
-                "chart_type": "bar",
-                "data": {}
-            },
-            "timeline": {
-                "type": "timeline",
-                "title": "タイムライン",
-                "events": [
-                    {"date": "Phase 1", "description": "説明"},
-                    {"date": "Phase 2", "description": "説明"}
-                ]
-            },
-            "conclusion": {
-                "type": "conclusion",
-                "title": "まとめ",
-                "body": ["要点1", "要点2", "次のステップ"]
-            },
-            "qa": {
-                "type": "qa",
-                "title": "Q&A",
-                "subtitle": "ご質問はありますか？"
-            },
-            "thank_you": {
-                "type": "thank_you",
-                "title": "ありがとうございました",
-                "contact": "お問い合わせ先"
-            }
-        }
-        return templates.get(slide_type, templates["content"])
+        template = _SLIDE_CONTENT_TEMPLATES.get(slide_type, _SLIDE_CONTENT_TEMPLATES["content"])
+        return _copy_template(template)
 
-    def save_theme(self, name: str, theme: Dict, path: Optional[Path] = None):
-        """Save a theme to a JSON file"""
+    def save_theme(self, name: str, theme: Dict, path: Optional[Path] = None, compact: bool = False):
+        """Save a theme to a JSON file (two-space indented unless ``compact``)"""
         save_path = path or (self.template_dir / f"theme_{name}.json" if self.template_dir else None)
         if save_path:
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(theme, f, ensure_ascii=False, indent=2)
+            if save_path.parent not in self._created_dirs:
+                save_path.parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(save_path.parent)
+            with open(save_path, 'wb') as f:
+                f.write(dumps_bytes(theme, pretty=not compact))
 
     def load_theme(self, path: Path) -> Dict:
         """Load a theme from a JSON file"""
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return loads(f.read())
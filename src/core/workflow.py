@@ -1,20 +1,47 @@
 """Workflow management for orchestrating multi-agent tasks"""
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from collections import Counter, deque
+from dataclasses import dataclass
 from .task import Task, TaskStatus
 from .message import Message, MessageType
-import uuid
+import asyncio
+import operator
+import secrets
+
+
+# Sort key for ready tasks (1 = highest priority; ties keep insertion order)
+_by_priority = operator.attrgetter("priority")
+
+# Statuses that count as finished for Workflow.is_complete
+_DONE_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED})
+
+# Default number of most recent messages a Workflow retains
+MESSAGE_BUFFER_SIZE = 10_000
 
 
 class Workflow:
     """Manages the workflow of tasks across multiple agents"""
 
-    def __init__(self, name: str, description: str = ""):
-        self.id = str(uuid.uuid4())[:8]
+    def __init__(self, name: str, description: str = "", message_buffer_size: int = MESSAGE_BUFFER_SIZE):
+        self.id = secrets.token_hex(4)
         self.name = name
         self.description = description
         self.tasks: Dict[str, Task] = {}
-        self.messages: List[Message] = []
+        # Oldest messages are dropped once message_buffer_size is reached
+        self.messages: Deque[Message] = deque(maxlen=message_buffer_size)
         self.completed_task_ids: List[str] = []
+        # Same IDs as a set, for dependency checks
+        self._completed_ids: Set[str] = set()
+
+    def reset(self, name: str, description: str = ""):
+        """Start a new workflow in place, reusing the existing containers"""
+        self.id = secrets.token_hex(4)
+        self.name = name
+        self.description = description
+        self.tasks.clear()
+        self.messages.clear()
+        self.completed_task_ids.clear()
+        self._completed_ids.clear()
 
     def add_task(self, task: Task) -> str:
         """Add a task to the workflow"""
@@ -27,11 +54,11 @@ class Workflow:
 
     def get_ready_tasks(self) -> List[Task]:
         """Get all tasks that are ready to be executed"""
-        ready = []
-        for task in self.tasks.values():
-            if task.status == TaskStatus.PENDING and task.is_ready(self.completed_task_ids):
-                ready.append(task)
-        return sorted(ready, key=lambda t: t.priority)
+        completed = self._completed_ids
+        return sorted(
+            (t for t in self.tasks.values() if t.status == TaskStatus.PENDING and t.is_ready(completed)),
+            key=_by_priority,
+        )
 
     def get_in_progress_tasks(self) -> List[Task]:
         """Get all tasks currently in progress"""
@@ -42,6 +69,7 @@ class Workflow:
         if task_id in self.tasks:
             self.tasks[task_id].complete(output_data)
             self.completed_task_ids.append(task_id)
+            self._completed_ids.add(task_id)
 
     def fail_task(self, task_id: str, error_message: str):
         """Mark a task as failed"""
@@ -54,10 +82,7 @@ class Workflow:
 
     def is_complete(self) -> bool:
         """Check if all tasks are completed"""
-        return all(
-            t.status in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
-            for t in self.tasks.values()
-        )
+        return all(t.status in _DONE_STATUSES for t in self.tasks.values())
 
     def has_failed(self) -> bool:
         """Check if any task has failed"""
@@ -66,9 +91,10 @@ class Workflow:
     def get_progress(self) -> dict:
         """Get workflow progress summary"""
         total = len(self.tasks)
-        completed = len([t for t in self.tasks.values() if t.status == TaskStatus.COMPLETED])
-        in_progress = len([t for t in self.tasks.values() if t.status == TaskStatus.IN_PROGRESS])
-        failed = len([t for t in self.tasks.values() if t.status == TaskStatus.FAILED])
+        counts = Counter(t.status for t in self.tasks.values())
+        completed = counts[TaskStatus.COMPLETED]
+        in_progress = counts[TaskStatus.IN_PROGRESS]
+        failed = counts[TaskStatus.FAILED]
 
         return {
             "total": total,
@@ -78,3 +104,65 @@ class Workflow:
             "pending": total - completed - in_progress - failed,
             "percent_complete": (completed / total * 100) if total > 0 else 0,
         }
+
+
+@dataclass(frozen=True, slots=True)
+class Node:
+    """
+    A unit of work in a WorkflowEngine graph.
+
+    ``run`` receives the results of all completed nodes, keyed by node id.
+    """
+    id: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    deps: Tuple[str, ...] = ()
+
+
+class WorkflowEngine:
+    """
+    Executes a DAG of Nodes, starting each node as soon as its
+    dependencies have finished so independent nodes overlap.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency
+
+    async def run(self, nodes: List[Node]) -> Dict[str, Any]:
+        """
+        Run all nodes and return their results keyed by id. Ready nodes are
+        started in declaration order. On the first failure no further nodes
+        are started, in-flight nodes are cancelled and the error is raised.
+        """
+        pending = {node.id: node for node in nodes}
+        for node in nodes:
+            missing = [d for d in node.deps if d not in pending]
+            if missing:
+                raise ValueError(f"Node '{node.id}' depends on unknown node(s): {missing}")
+
+        done: Dict[str, Any] = {}
+        running: Dict[asyncio.Task, str] = {}
+
+        try:
+            while pending or running:
+                for node_id, node in list(pending.items()):
+                    if self.max_concurrency and len(running) >= self.max_concurrency:
+                        break
+                    if all(d in done for d in node.deps):
+                        del pending[node_id]
+                        running[asyncio.create_task(node.run(done))] = node_id
+
+                if not running:
+                    raise ValueError(f"Dependency cycle among nodes: {list(pending)}")
+
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # Record results in start order for deterministic scheduling
+                for task in [t for t in running if t in finished]:
+                    node_id = running.pop(task)
+                    done[node_id] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return done
@@ -0,0 +1,27 @@
+"""Deferred imports for heavy optional-at-startup libraries"""
+from typing import Any, Dict, Optional
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    When ``namespace`` (a module's ``globals()``) and ``alias`` are given,
+    the real module replaces the stand-in there on first use, so later
+    lookups go straight to the module.
+    """
+
+    def __init__(self, name: str, namespace: Optional[Dict[str, Any]] = None, alias: Optional[str] = None):
+        self._name = name
+        self._namespace = namespace
+        self._alias = alias or name
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self._name)
+        if self._namespace is not None:
+            self._namespace[self._alias] = module
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._name!r}>"
@@ -0,0 +1,43 @@
+"""JSON serialization helpers (uses orjson when it is installed)"""
+from typing import Any, Union
+import json
+
+# Try to import orjson for faster serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_bytes(data: Any, sort_keys: bool = False, pretty: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON; unknown types fall back to str().
+    Output is compact unless ``pretty`` (two-space indent).
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+
+    layout = {"indent": 2} if pretty else {"separators": (",", ":")}
+    try:
+        text = json.dumps(data, sort_keys=sort_keys, ensure_ascii=False, default=str, **layout)
+    except TypeError:  # mixed key types cannot be sorted
+        text = json.dumps(data, ensure_ascii=False, default=str, **layout)
+    return text.encode("utf-8")
+
+
+def dumps(data: Any, sort_keys: bool = False, pretty: bool = False) -> str:
+    """Serialize to a JSON string (compact unless ``pretty``)"""
+    return dumps_bytes(data, sort_keys=sort_keys, pretty=pretty).decode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON; errors are json.JSONDecodeError (orjson's subclasses it)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)